@@ -10,6 +10,7 @@ This module consolidates all board status-related code including:
 Used by: sequence.py, gridcell.py, board_detail_popup.py, kvui.py
 """
 
+import itertools
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Dict, List, Tuple
@@ -156,6 +157,15 @@ def status_to_dot(status_name: str, enabled: bool, spinner_index: int = 0) -> Tu
         return (DOT_PENDING, False)
 
 
+# Phase colors for the detail popup - shared instances, never mutated
+# (Kivy copies list values into its properties)
+PHASE_COLOR_PASSED = [0.3, 0.8, 0.3, 1]  # Green
+PHASE_COLOR_FAILED = [0.9, 0.3, 0.3, 1]  # Red
+PHASE_COLOR_ACTIVE = [0.3, 0.6, 1, 1]  # Blue
+PHASE_COLOR_SKIPPED = [0.6, 0.6, 0.6, 1]  # Gray
+PHASE_COLOR_PENDING = [0.8, 0.8, 0.8, 1]  # Light gray (idle/pending)
+
+
 def get_phase_color(status_name: str) -> List[float]:
     """Get RGBA color for a phase status (used in detail popup).
     
@@ -166,15 +176,21 @@ def get_phase_color(status_name: str) -> List[float]:
         RGBA color list [r, g, b, a] with values 0-1
     """
     if status_name in PASSED_STATUSES:
-        return [0.3, 0.8, 0.3, 1]  # Green
+        return PHASE_COLOR_PASSED
     elif status_name == "FAILED":
-        return [0.9, 0.3, 0.3, 1]  # Red
+        return PHASE_COLOR_FAILED
     elif status_name in IN_PROGRESS_STATUSES or status_name in ("RUNNING", "CAPTURING"):
-        return [0.3, 0.6, 1, 1]  # Blue
+        return PHASE_COLOR_ACTIVE
     elif status_name == "SKIPPED":
-        return [0.6, 0.6, 0.6, 1]  # Gray
+        return PHASE_COLOR_SKIPPED
     else:
-        return [0.8, 0.8, 0.8, 1]  # Light gray (idle/pending)
+        return PHASE_COLOR_PENDING
+
+
+# Background colors already decided, keyed by (enabled, vision, probe, program,
+# provision, test) enum members. The key space is small and fixed, so the
+# priority rules below run at most once per distinct combination.
+_BG_COLOR_CACHE: Dict[tuple, List[float]] = {}
 
 
 def get_status_bg_color(board_status) -> List[float]:
@@ -189,6 +205,22 @@ def get_status_bg_color(board_status) -> List[float]:
     Returns:
         RGBA color list [r, g, b, a] with values 0-1
     """
+    key = (
+        board_status.enabled,
+        board_status.vision_status,
+        board_status.probe_status,
+        board_status.program_status,
+        board_status.provision_status,
+        board_status.test_status,
+    )
+    color = _BG_COLOR_CACHE.get(key)
+    if color is None:
+        color = _BG_COLOR_CACHE[key] = _compute_status_bg_color(board_status)
+    return color
+
+
+def _compute_status_bg_color(board_status) -> List[float]:
+    """Apply the background color priority rules (see get_status_bg_color)."""
     if not board_status.enabled:
         return STATUS_COLORS['disabled']
     
@@ -253,12 +285,14 @@ def is_processing(board_status) -> bool:
     Returns:
         True if any phase is in progress
     """
+    program = board_status.program_status
     return (
-        board_status.vision_status.name == "IN_PROGRESS" or
-        board_status.probe_status.name == "PROBING" or
-        board_status.program_status.name in ("PROGRAMMING", "IDENTIFYING") or
-        board_status.provision_status.name == "PROVISIONING" or
-        board_status.test_status.name == "TESTING"
+        board_status.vision_status is VisionStatus.IN_PROGRESS or
+        board_status.probe_status is ProbeStatus.PROBING or
+        program is ProgramStatus.PROGRAMMING or
+        program is ProgramStatus.IDENTIFYING or
+        board_status.provision_status is ProvisionStatus.PROVISIONING or
+        board_status.test_status is TestStatus.TESTING
     )
 
 
@@ -359,8 +393,21 @@ class BoardInfo:
         return f"BoardInfo(serial={self.serial_number}, pos={self.position})"
 
 
+# Source of BoardStatus.rev values - global so that a fresh BoardStatus can
+# never repeat a revision a GridCell has already rendered for an older one
+_revision_counter = itertools.count(1)
+
+
 class BoardStatus:
-    """Tracks the status of a single board position."""
+    """Tracks the status of a single board position.
+    
+    Every attribute assignment bumps ``rev`` so consumers (GridCell) can skip
+    redrawing when nothing changed since they last looked.
+    """
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, 'rev', next(_revision_counter))
     
     def __init__(self, position: Tuple[int, int]):
         """Initialize board status.
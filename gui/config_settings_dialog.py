@@ -54,7 +54,7 @@ class ConfigSettingsController(CameraPreviewMixin, JoggingMixin):
         
         # Initialize jogging state from mixin
         self._init_jogging_state()
-        self._jog_widget_prefix = 'cs'  # Use 'cs_' prefix for widget IDs
+        self.set_jog_widget_prefix('cs')  # Use 'cs_' prefix for widget IDs
     
     @property
     def bot(self):
@@ -417,11 +417,9 @@ class ConfigSettingsController(CameraPreviewMixin, JoggingMixin):
                 
                 # Ensure at safe Z first
                 await self.bot.motion.rapid_z_abs(0.0)
-                await self.bot.motion.send_gcode_wait_ok("M400")
                 
                 # Move to target position
                 await self.bot.motion.rapid_xy_abs(target_x, target_y)
-                await self.bot.motion.send_gcode_wait_ok("M400")
                 
                 # Update position display
                 self._refresh_jog_position()
@@ -429,7 +427,7 @@ class ConfigSettingsController(CameraPreviewMixin, JoggingMixin):
             except Exception as e:
                 log.debug(f"[ConfigSettings] Error moving to camera position: {e}")
         
-        asyncio.ensure_future(do_move())
+        self._start_jog_task('_jog_task', do_move())
     
     def reset_camera_offset(self):
         """Reset camera offset values to what they were when entering the Camera tab."""
@@ -464,7 +462,6 @@ class ConfigSettingsController(CameraPreviewMixin, JoggingMixin):
                 log.debug(f"[ConfigSettings] Moving to reset position: ({target_x:.2f}, {target_y:.2f})")
                 
                 await self.bot.motion.rapid_xy_abs(target_x, target_y)
-                await self.bot.motion.send_gcode_wait_ok("M400")
                 
                 self._refresh_jog_position()
                 
@@ -483,7 +480,7 @@ class ConfigSettingsController(CameraPreviewMixin, JoggingMixin):
             except Exception as e:
                 log.debug(f"[ConfigSettings] Reset camera position error: {e}")
         
-        asyncio.ensure_future(do_move())
+        self._start_jog_task('_jog_task', do_move())
     
     def on_camera_offset_x_change(self, text):
         """Handle camera offset X input change."""
@@ -540,13 +537,15 @@ class ConfigSettingsController(CameraPreviewMixin, JoggingMixin):
         
         Formula: displayed = machine_pos - board_origin
         """
+        if not self._has_jog_labels():
+            return
+        
         async def do_refresh():
             try:
                 if not self.bot or not self.bot.motion:
                     return
                 
-                pos = await self.bot.motion.get_position()
-                machine_x, machine_y = pos['x'], pos['y']
+                machine_x, machine_y = await self._cached_get_position(max_age=0)
                 
                 # Get board origin from panel settings
                 ps = self.app.panel_settings
@@ -557,23 +556,16 @@ class ConfigSettingsController(CameraPreviewMixin, JoggingMixin):
                 rel_x = machine_x - board_x
                 rel_y = machine_y - board_y
                 
-                log.debug(f"[ConfigSettings] Position refresh: machine=({machine_x:.2f},{machine_y:.2f}), "
-                         f"board_origin=({board_x:.2f},{board_y:.2f}), "
-                         f"rel=({rel_x:.2f},{rel_y:.2f})")
+                log.debug("[ConfigSettings] Position refresh: machine=(%.2f,%.2f), "
+                          "board_origin=(%.2f,%.2f), rel=(%.2f,%.2f)",
+                          machine_x, machine_y, board_x, board_y, rel_x, rel_y)
                 
-                def update_labels(dt, rel_x=rel_x, rel_y=rel_y):
-                    if not self.popup:
-                        return
-                    if x_label := self.popup.ids.get('cs_jog_pos_x'):
-                        x_label.text = f"X: {rel_x:.2f}"
-                    if y_label := self.popup.ids.get('cs_jog_pos_y'):
-                        y_label.text = f"Y: {rel_y:.2f}"
-                Clock.schedule_once(update_labels, 0)
+                self._update_jog_labels(rel_x, rel_y)
                 
             except Exception as e:
                 log.debug(f"[ConfigSettings] Position refresh error: {e}")
         
-        asyncio.ensure_future(do_refresh())
+        self._start_jog_task('_refresh_task', do_refresh(), cancel_previous=True)
     
     def capture_camera_offset(self):
         """Capture current position as camera offset relative to board origin.
@@ -589,8 +581,7 @@ class ConfigSettingsController(CameraPreviewMixin, JoggingMixin):
                     log.debug("[ConfigSettings] No motion controller for offset capture")
                     return
                 
-                pos = await self.bot.motion.get_position()
-                machine_x, machine_y = pos['x'], pos['y']
+                machine_x, machine_y = await self._cached_get_position()
                 
                 # Get board origin from panel settings
                 ps = self.app.panel_settings
@@ -605,16 +596,13 @@ class ConfigSettingsController(CameraPreviewMixin, JoggingMixin):
                          f"board_origin=({board_x:.2f},{board_y:.2f}), "
                          f"offset=({offset_x:.2f},{offset_y:.2f})")
                 
-                # Call the handler on main thread
-                def call_handler(dt, x=offset_x, y=offset_y):
-                    self._on_camera_offset_captured(x, y)
-                
-                Clock.schedule_once(call_handler, 0)
+                # Already on the Kivy event loop thread (async_run)
+                self._on_camera_offset_captured(offset_x, offset_y)
                 
             except Exception as e:
                 log.debug(f"[ConfigSettings] Offset capture error: {e}")
         
-        asyncio.ensure_future(do_capture())
+        self._start_jog_task('_capture_task', do_capture())
     
     def _on_camera_offset_captured(self, offset_x, offset_y):
         """Handle captured camera offset.
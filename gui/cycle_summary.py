@@ -18,15 +18,25 @@ import logging
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, asdict
+from functools import cached_property
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from kivy.uix.popup import Popup
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.properties import StringProperty
 from kivy.graphics import Color, RoundedRectangle
+from kivy.factory import Factory
 
 log = logging.getLogger(__name__)
 
@@ -47,9 +57,9 @@ class BoardResult:
     captured_data: Dict[str, Any] = field(default_factory=dict)  # mac, bt_addr, etc.
     phase_times: Dict[str, float] = field(default_factory=dict)  # Timing per phase
     
-    @property
+    @cached_property
     def total_time(self) -> float:
-        """Total time across all phases."""
+        """Total time across all phases (phase_times is final once built)."""
         return sum(self.phase_times.values())
     
     def to_dict(self) -> dict:
@@ -111,20 +121,25 @@ class CycleSummary:
             'boards': [b.to_dict() for b in self.boards],
         }
     
-    def to_csv_rows(self) -> List[List[str]]:
+    def to_csv_rows(self) -> List[List[Any]]:
         """Convert to CSV rows (header + data rows)."""
-        # Collect all captured data keys across all boards
-        all_keys = set()
+        return list(self.iter_csv_rows())
+    
+    def iter_csv_rows(self) -> Iterator[List[Any]]:
+        """Yield CSV rows (header first, then one row per board)."""
+        # Collect all captured data keys across all boards (insertion-ordered
+        # union, then sorted once so column order stays deterministic)
+        all_keys = {}
         for b in self.boards:
-            all_keys.update(b.captured_data.keys())
+            all_keys.update(dict.fromkeys(b.captured_data))
         all_keys = sorted(all_keys)
         
         # Header
         header = ['serial', 'position', 'result', 'failure_phase', 'failure_reason']
         header.extend(all_keys)
+        yield header
         
         # Data rows
-        rows = [header]
         for b in self.boards:
             row = [
                 b.serial,
@@ -133,11 +148,11 @@ class CycleSummary:
                 b.failure_phase or '',
                 b.failure_reason or '',
             ]
+            # csv.writer stringifies values itself (None is written as '')
+            captured = b.captured_data
             for key in all_keys:
-                row.append(str(b.captured_data.get(key, '')))
-            rows.append(row)
-        
-        return rows
+                row.append(captured.get(key, ''))
+            yield row
 
 
 # =============================================================================
@@ -162,6 +177,16 @@ class CycleResultHandler(ABC):
     async def on_board_complete(self, result: BoardResult) -> None:
         """Called when each board finishes (for real-time updates)."""
         pass
+    
+    async def on_board_batch_complete(self, results: List[BoardResult]) -> None:
+        """Called with several boards that finished close together.
+        
+        The default forwards to on_board_complete() one at a time. Override
+        to coalesce the batch into a single round-trip (e.g. one HTTP POST
+        or one DB transaction).
+        """
+        for result in results:
+            await self.on_board_complete(result)
 
 
 class NullHandler(CycleResultHandler):
@@ -172,6 +197,16 @@ class NullHandler(CycleResultHandler):
     
     async def on_board_complete(self, result: BoardResult) -> None:
         pass
+    
+    async def on_board_batch_complete(self, results: List[BoardResult]) -> None:
+        pass
+
+
+def _json_default(obj):
+    """Serialize values the JSON encoders don't handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class FileExportHandler(CycleResultHandler):
@@ -205,23 +240,77 @@ class FileExportHandler(CycleResultHandler):
         """Not used for file export - only export at cycle end."""
         pass
     
+    async def on_board_batch_complete(self, results: List[BoardResult]) -> None:
+        """Not used for file export - only export at cycle end."""
+        pass
+    
     def _write_csv(self, path: str, summary: CycleSummary) -> None:
         """Write summary to CSV file."""
-        rows = summary.to_csv_rows()
-        with open(path, 'w', newline='') as f:
+        # Stream rows straight from the generator; the 1 MiB buffer keeps
+        # write() syscalls to a handful even for large cycles
+        with open(path, 'w', newline='', buffering=1 << 20) as f:
             writer = csv.writer(f)
-            writer.writerows(rows)
+            writer.writerows(summary.iter_csv_rows())
     
     def _write_json(self, path: str, summary: CycleSummary) -> None:
-        """Write summary to JSON file."""
-        with open(path, 'w') as f:
-            json.dump(summary.to_dict(), f, indent=2)
+        """Write summary to JSON file (uses orjson when available)."""
+        if HAS_ORJSON:
+            # orjson produces UTF-8 bytes directly, so skip the text re-encode
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(summary.to_dict(), default=_json_default,
+                                     option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(summary.to_dict(), f, indent=2, default=_json_default)
 
 
 # =============================================================================
 # Summary Popup Widget
 # =============================================================================
 
+class FailedBoardItem(BoxLayout):
+    """RecycleView row for a single failed board."""
+    
+    board_text = StringProperty('')
+    reason_text = StringProperty('')
+    
+    def __init__(self, **kwargs):
+        super().__init__(orientation='vertical', padding=[10, 2], **kwargs)
+        
+        with self.canvas.before:
+            Color(0.25, 0.15, 0.15, 1)
+            self._rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[4])
+        self.bind(pos=lambda w, p: setattr(w._rect, 'pos', p))
+        self.bind(size=lambda w, s: setattr(w._rect, 'size', s))
+        
+        board_label = Label(
+            text=self.board_text,
+            font_size='13sp',
+            halign='left',
+            valign='middle',
+            size_hint_y=0.5,
+            color=[0.9, 0.7, 0.7, 1]
+        )
+        board_label.bind(size=board_label.setter('text_size'))
+        self.bind(board_text=board_label.setter('text'))
+        self.add_widget(board_label)
+        
+        reason_label = Label(
+            text=self.reason_text,
+            font_size='11sp',
+            halign='left',
+            valign='middle',
+            size_hint_y=0.5,
+            color=[0.6, 0.5, 0.5, 1]
+        )
+        reason_label.bind(size=reason_label.setter('text_size'))
+        self.bind(reason_text=reason_label.setter('text'))
+        self.add_widget(reason_label)
+
+
+Factory.register('FailedBoardItem', cls=FailedBoardItem)
+
+
 class CycleSummaryPopup:
     """Popup widget displaying cycle results."""
     
@@ -388,62 +477,43 @@ class CycleSummaryPopup:
         header.bind(size=header.setter('text_size'))
         section.add_widget(header)
         
-        # Scrollable list
-        scroll = ScrollView(size_hint_y=None, height=min(150, len(failed_boards) * 50))
-        
-        failed_list = BoxLayout(orientation='vertical', size_hint_y=None, spacing=5)
+        # Scrollable list - fixed viewport height, RecycleView only instantiates
+        # the rows that are actually visible regardless of how many boards failed
+        scroll = RecycleView(
+            size_hint_y=None,
+            height=150,
+            viewclass='FailedBoardItem',
+            do_scroll_x=False,
+        )
+        failed_list = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, 45),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            spacing=5,
+        )
         failed_list.bind(minimum_height=failed_list.setter('height'))
-        
-        for board in failed_boards:
-            item = self._build_failed_item(board)
-            failed_list.add_widget(item)
-        
         scroll.add_widget(failed_list)
+        scroll.data = [self._failed_item_data(board) for board in failed_boards]
         section.add_widget(scroll)
         
         return section
     
-    def _build_failed_item(self, board: BoardResult) -> BoxLayout:
-        """Build a single failed board item."""
-        item = BoxLayout(orientation='vertical', size_hint_y=None, height=45, padding=[10, 2])
-        
-        with item.canvas.before:
-            Color(0.25, 0.15, 0.15, 1)
-            item._rect = RoundedRectangle(pos=item.pos, size=item.size, radius=[4])
-        item.bind(pos=lambda w, p: setattr(w._rect, 'pos', p))
-        item.bind(size=lambda w, s: setattr(w._rect, 'size', s))
-        
+    def _failed_item_data(self, board: BoardResult) -> dict:
+        """Build the RecycleView data entry for a single failed board."""
         # Board identifier
         col, row = board.position
         board_text = f"Board {board.cell_id} [{col},{row}]"
         if board.serial:
             board_text += f" - {board.serial}"
         
-        board_label = Label(
-            text=board_text,
-            font_size='13sp',
-            halign='left',
-            valign='middle',
-            size_hint_y=0.5,
-            color=[0.9, 0.7, 0.7, 1]
-        )
-        board_label.bind(size=board_label.setter('text_size'))
-        item.add_widget(board_label)
-        
         # Failure reason
         reason_text = f"{board.failure_phase}: {board.failure_reason}" if board.failure_phase else board.failure_reason
-        reason_label = Label(
-            text=reason_text or "Unknown error",
-            font_size='11sp',
-            halign='left',
-            valign='middle',
-            size_hint_y=0.5,
-            color=[0.6, 0.5, 0.5, 1]
-        )
-        reason_label.bind(size=reason_label.setter('text_size'))
-        item.add_widget(reason_label)
         
-        return item
+        return {
+            'board_text': board_text,
+            'reason_text': reason_text or "Unknown error",
+        }
     
     def _build_buttons(self, summary: CycleSummary) -> BoxLayout:
         """Build action buttons row."""
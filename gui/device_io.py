@@ -1,100 +1,239 @@
 """Async I/O operations for serial device communication and hardware control."""
 import asyncio
-import serial_asyncio
+import collections
+import functools
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+import serial
+
 from logger import get_logger
 
 log = get_logger(__name__)
 
+# Longest a single send_command() attempt waits before retrying (the final
+# attempt always gets whatever time is left before the overall deadline)
+ATTEMPT_TIMEOUT_CAP = 2.0
+
+# Most unread lines kept per device; older lines are dropped (and logged)
+LINE_BUFFER_MAX = 256
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_command(command, newline):
+    """Encode a send_command() command, appending a newline if requested.
+
+    LRU-bounded so G-code moves with embedded coordinates age out instead of
+    crowding out the fixed commands that repeat every cycle.
+    """
+    # Ensure command ends with newline if the hardware expects it
+    text = command + '\n' if newline and not command.endswith('\n') else command
+    return text.encode()
+
+
+class _SerialWriter:
+    """StreamWriter-style wrapper that performs writes on the device's I/O thread."""
+    
+    def __init__(self, ser, executor):
+        self._ser = ser
+        self._executor = executor
+        self._last_write = None
+        self._closing = False
+    
+    def write(self, data):
+        """Queue data for writing (writes are executed in order)."""
+        loop = asyncio.get_running_loop()
+        self._last_write = loop.run_in_executor(self._executor, self._ser.write, data)
+    
+    async def drain(self):
+        """Wait until the most recently queued write has completed."""
+        if self._last_write is not None:
+            fut, self._last_write = self._last_write, None
+            await fut
+    
+    def is_closing(self):
+        return self._closing or not self._ser.is_open
+    
+    def close(self):
+        self._closing = True
+        self._ser.close()
+
 
 class AsyncSerialDevice:
-    """Manages async serial communication with a device."""
+    """Manages async serial communication with a device.
     
-    def __init__(self, port, baudrate):
+    Serial I/O runs on dedicated threads so the byte pump is not stalled by
+    Kivy redraws or other work on the asyncio event loop. Received lines are
+    handed back to the loop with call_soon_threadsafe().
+    """
+    
+    def __init__(self, port, baudrate, max_inflight=1):
+        """
+        Args:
+            port: Serial port device path
+            baudrate: Baud rate
+            max_inflight: How many send_command() calls may be outstanding at
+                once. Responses are matched to commands in arrival order, so
+                only raise this for devices that answer every command with
+                exactly one line, in order.
+        """
         self.port = port
         self.baudrate = baudrate
-        self.reader = None
+        self.serial = None
         self.writer = None
-        # Queue to store full lines received from the device
-        self.line_queue = asyncio.Queue()
-        self._reader_task = None  # Store task reference for cleanup
+        # Full lines received from the device when no send_command() is
+        # waiting for a response; read with read_line()/drain_lines().
+        # Bounded so unread lines can't accumulate for the whole connection
+        self._lines = collections.deque(maxlen=LINE_BUFFER_MAX)
+        self._line_event = asyncio.Event()
+        # Futures owned by in-flight send_command() calls, oldest first; the
+        # reader hands each line straight to the oldest one instead of going
+        # through the line buffer
+        self._pending = collections.deque()
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._tx_executor = None  # Single worker thread for open/write
+        self._reader_thread = None  # Store thread reference for cleanup
+        self._reader_stop = threading.Event()
 
     async def connect(self):
         """Initializes connection and background reader."""
-        # If already connected, don't create duplicate reader task
-        if self.reader is not None and self._reader_task is not None:
+        # If already connected, don't create duplicate reader thread
+        if self.serial is not None and self._reader_thread is not None:
             log.debug(f"[{self.port}] Already connected, skipping duplicate connect()")
             return
         
-        self.reader, self.writer = await serial_asyncio.open_serial_connection(
-            url=self.port,
+        loop = asyncio.get_running_loop()
+        self._tx_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"serial-tx-{self.port}")
+        self.serial = await loop.run_in_executor(self._tx_executor, functools.partial(
+            serial.Serial,
+            port=self.port,
             baudrate=self.baudrate,
             bytesize=8,
             parity='N',
             stopbits=1,
-            timeout=1,
+            timeout=0.05,  # Short timeout so the reader notices stop requests
             xonxoff=False,
             rtscts=False,
             dsrdtr=False
-        )
+        ))
+        self.writer = _SerialWriter(self.serial, self._tx_executor)
         log.debug(f"Connected: {self.port} ({self.baudrate} baud, 8N1)")
-        # Run the reader task forever and store reference
-        self._reader_task = asyncio.create_task(self._run_reader())
+        # Run the reader thread forever and store reference
+        self._reader_stop.clear()
+        self._reader_thread = threading.Thread(
+            target=self._run_reader,
+            args=(self.serial, loop, self._reader_stop),
+            name=f"serial-rx-{self.port}",
+            daemon=True,
+        )
+        self._reader_thread.start()
+
+    def is_alive(self):
+        """Cheap health check: port open and reader thread still running."""
+        return (
+            self.writer is not None
+            and not self.writer.is_closing()
+            and self._reader_thread is not None
+            and self._reader_thread.is_alive()
+        )
 
     async def disconnect_async(self):
-        """Properly disconnect and wait for reader task to complete."""
+        """Properly disconnect and wait for reader thread to complete."""
         log.debug(f"[{self.port}] disconnect_async called")
         
-        # Force close transport to immediately release the serial port
+        # Ask the reader thread to stop and wait for it to exit
+        self._reader_stop.set()
+        # The reader's read timeout is short, so it normally exits within one
+        # poll; closing the port below unblocks it if it hasn't by then
+        if self._reader_thread and self._reader_thread.is_alive():
+            log.debug(f"[{self.port}] Waiting for reader thread to complete...")
+            for _ in range(100):
+                if not self._reader_thread.is_alive():
+                    break
+                await asyncio.sleep(0.01)
+            if self._reader_thread.is_alive():
+                log.debug(f"[{self.port}] Reader thread still running, closing port anyway")
+            else:
+                log.debug(f"[{self.port}] Reader thread completed")
+        
+        # Close the port to release it
         if self.writer:
-            log.debug(f"[{self.port}] Force closing transport...")
+            log.debug(f"[{self.port}] Closing serial port...")
             try:
-                if hasattr(self.writer, 'transport') and self.writer.transport:
-                    self.writer.transport.abort()
-                    log.debug(f"[{self.port}] Transport aborted")
-                else:
-                    self.writer.close()
-                    log.debug(f"[{self.port}] Writer closed")
+                self.writer.close()
+                log.debug(f"[{self.port}] Serial port closed")
             except Exception as e:
                 log.debug(f"[{self.port}] Error closing: {e}")
         
-        # Now wait for reader task to actually finish
-        if self._reader_task and not self._reader_task.done():
-            log.debug(f"[{self.port}] Waiting for reader task to complete...")
-            try:
-                await asyncio.wait_for(self._reader_task, timeout=1.0)
-                log.debug(f"[{self.port}] Reader task completed")
-            except (asyncio.CancelledError, asyncio.TimeoutError, Exception) as e:
-                log.debug(f"[{self.port}] Reader task ended: {type(e).__name__}")
+        if self._tx_executor:
+            self._tx_executor.shutdown(wait=False)
         
-        self.reader = None
+        self.serial = None
         self.writer = None
-        self._reader_task = None
+        self._tx_executor = None
+        self._reader_thread = None
         log.debug(f"[{self.port}] disconnect_async complete")
 
-    async def _run_reader(self):
-        """Constantly reads from serial and splits by newline."""
-        log.debug(f"[{self.port}] Reader task started")
-        while True:
+    def _run_reader(self, ser, loop, stop):
+        """Reader thread: constantly reads from serial and splits by newline."""
+        log.debug(f"[{self.port}] Reader thread started")
+        # Read whatever is available in bulk and split lines ourselves
+        rxbuf = bytearray()
+        while not stop.is_set():
             try:
-                # readline() specifically waits for the \n delimiter
-                read_start = time.time()
-                line = await self.reader.readline()
-                read_time = time.time() - read_start
-                if line:
-                    # Clean and put into the queue for the 'await' caller
-                    decoded_line = line.decode('latin1').strip()
-                    # Only log slow reads (> 1 second) to reduce log spam
-                    if read_time > 1.0:
-                        log.debug(f"[{self.port}] Slow read: {repr(decoded_line)} (took {read_time:.3f}s)")
-                    await self.line_queue.put(decoded_line)
-                else:
-                    log.debug(f"[{self.port}] readline() returned empty - connection may be closed")
-                    break
+                chunk = ser.read(ser.in_waiting or 1)
+                if not chunk:
+                    continue  # Read timeout, check for stop request
+                rxbuf += chunk
+                while (i := rxbuf.find(b'\n')) >= 0:
+                    line = bytes(rxbuf[:i])
+                    del rxbuf[:i + 1]
+                    # Clean and hand off to the event loop
+                    loop.call_soon_threadsafe(self._deliver, line.decode('latin1').strip())
             except Exception as e:
                 log.debug(f"[{self.port}] Error reading: {e}")
                 break
-        log.debug(f"[{self.port}] Reader task exited")
+        log.debug(f"[{self.port}] Reader thread exited")
+
+    def _deliver(self, line):
+        """Route a received line to the oldest waiting command, or queue it.
+        
+        Timed-out commands remove their own future from _pending, so a late
+        reply normally lands in the line buffer and is discarded before the
+        next send. A future cancelled but not yet removed is skipped here.
+        """
+        pending = self._pending
+        while pending:
+            fut = pending.popleft()
+            if not fut.done():
+                fut.set_result(line)
+                return
+        if len(self._lines) == LINE_BUFFER_MAX:
+            log.debug(f"[{self.port}] Line buffer full, dropping oldest: {self._lines[0]!r}")
+        self._lines.append(line)
+        self._line_event.set()
+
+    async def read_line(self, timeout=None):
+        """Return the next received line not consumed by send_command().
+        
+        Raises:
+            asyncio.TimeoutError: If no line arrives within timeout seconds
+        """
+        if not self._lines:
+            await asyncio.wait_for(self._wait_for_line(), timeout)
+        return self._lines.popleft()
+
+    async def _wait_for_line(self):
+        while not self._lines:
+            self._line_event.clear()
+            await self._line_event.wait()
+
+    def drain_lines(self):
+        """Discard and return any lines waiting to be read."""
+        lines = list(self._lines)
+        self._lines.clear()
+        return lines
 
     async def send_command(self, command, timeout=5.0, newline=True, retries=1):
         """
@@ -103,35 +242,55 @@ class AsyncSerialDevice:
         
         Args:
             command: Command string to send
-            timeout: Total timeout for all retries
+            timeout: Overall deadline for all attempts, in seconds
             newline: Whether to append newline to command
             retries: Number of attempts to make (default 1 = no retry)
         """
-        start_time = time.time()
         
-        # Ensure command ends with newline if the hardware expects it
-        if newline and not command.endswith('\n'):
-            command += '\n'
+        data = _encode_command(command, newline)
+        return await self.send_command_raw(data, timeout=timeout, retries=retries)
 
-        # Calculate timeout per attempt
-        timeout_per_attempt = timeout / retries if retries > 0 else timeout
+    async def send_command_raw(self, data, timeout=5.0, retries=1):
+        """
+        Sends pre-encoded command bytes (including any newline) and awaits
+        the next full line from the hardware. Retries on timeout.
+        
+        Args:
+            data: Command bytes to write as-is
+            timeout: Overall deadline for all attempts, in seconds
+            retries: Number of attempts to make (default 1 = no retry)
+        """
+        deadline = time.monotonic() + timeout
         
+        loop = asyncio.get_running_loop()
         last_error = None
         for attempt in range(retries):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Give early attempts a generous but bounded wait, and the last
+            # one everything that's left
+            if attempt < retries - 1:
+                attempt_timeout = min(remaining, ATTEMPT_TIMEOUT_CAP)
+            else:
+                attempt_timeout = remaining
+            
+            # The reader resolves this future with the line answering this
+            # command; queueing it and the write without awaiting in between
+            # keeps futures in the same order as the commands on the wire
+            fut = loop.create_future()
             try:
-                # Clear any old data in the queue so we don't get a stale response
-                queue_size = self.line_queue.qsize()
-                if queue_size > 0:
-                    log.debug(f"[{self.port}] WARNING: Queue had {queue_size} items, clearing")
-                while not self.line_queue.empty():
-                    self.line_queue.get_nowait()
-
-                # Send the command
-                self.writer.write(command.encode())
-                await self.writer.drain()
-
-                # Wait for the next line to arrive in the queue
-                result = await asyncio.wait_for(self.line_queue.get(), timeout=timeout_per_attempt)
+                async with self._inflight:
+                    # Nothing else is waiting, so any buffered line is a late
+                    # reply or unsolicited output - not this command's answer
+                    if not self._pending and (stale := self.drain_lines()):
+                        log.debug(f"[{self.port}] Discarding {len(stale)} stale line(s): {stale}")
+                    self._pending.append(fut)
+                    self.writer.write(data)
+                    await self.writer.drain()
+
+                    # Wait for the response line
+                    result = await asyncio.wait_for(fut, timeout=attempt_timeout)
                 # Success! Return the result
                 return result
                 
@@ -139,9 +298,17 @@ class AsyncSerialDevice:
                 last_error = e
                 if attempt < retries - 1:
                     log.debug(f"[{self.port}] Timeout on attempt {attempt+1}/{retries}, retrying...")
-                    await asyncio.sleep(0.1)  # Brief delay before retry
+                    await asyncio.sleep(min(0.1 * 2 ** attempt, 0.5))  # Back off before retry
                 else:
                     log.debug(f"[{self.port}] All {retries} attempts failed")
+            finally:
+                if not fut.done():
+                    fut.cancel()
+                # A timed-out attempt must not keep a slot in the reply order
+                try:
+                    self._pending.remove(fut)
+                except ValueError:
+                    pass  # Already consumed by the reader
         
         # All retries exhausted
         raise TimeoutError(f"Device {self.port} failed to respond after {retries} attempts (timeout={timeout}s)")
@@ -5,6 +5,8 @@ with visual indicators for each phase, serial number, and pass/fail status.
 """
 
 import time
+from contextlib import contextmanager
+from weakref import WeakSet
 
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.behaviors import ButtonBehavior
@@ -15,15 +17,79 @@ from kivy.lang.builder import Builder
 from logger import get_logger
 from board_status import (
     status_to_dot, get_status_bg_color, is_processing,
-    DOT_PASS, DOT_FAIL, DOT_PENDING, DOT_DISABLED, SPINNER_FRAMES
+    DOT_PASS, DOT_FAIL, DOT_PENDING, DOT_DISABLED, SPINNER_FRAMES,
+    VisionStatus, ProbeStatus, ProgramStatus, ProvisionStatus, TestStatus
 )
 
 log = get_logger(__name__)
 
+# Shared RGBA constants - assigned by name instead of building a new list on
+# every update (ListProperty copies them, so they are never mutated)
+BG_ON = [0.5, 0.5, 0.5, 1]  # Mid-gray
+BG_OFF = [0, 0, 0, 1]  # Black
+COLOR_WHITE = [1, 1, 1, 1]
+COLOR_DIM = [0.4, 0.4, 0.4, 1]  # Dark gray
+COLOR_RED = [1, 0.3, 0.3, 1]
+COLOR_GREEN = [0.3, 1, 0.3, 1]
+
+# Hold time (seconds) that turns a tap into a skip toggle
+LONG_PRESS_TIME = 0.5
+
+# Statuses that count as a pass for the result icon, per phase
+_PROGRAM_OK = frozenset((ProgramStatus.COMPLETED, ProgramStatus.IDENTIFIED))
+
+# Any of these shows the failure icon
+_FAILED_STATUSES = frozenset((
+    VisionStatus.FAILED, ProbeStatus.FAILED, ProgramStatus.FAILED,
+    ProvisionStatus.FAILED, TestStatus.FAILED,
+))
+
+# Phase dot properties, cleared together by reset_status()
+_DOT_PROPS = ('vision_dot', 'contact_dot', 'program_dot', 'provision_dot', 'test_dot')
+
+# Compatibility status text lines (see update_status)
+_STATUS_LINE_PROPS = ('status_line1', 'status_line2', 'status_line3', 'status_line4')
+
+# Phase enabled properties, in the order used by set_phase_flags()
+PHASE_FLAG_PROPS = ('vision_enabled', 'contact_enabled', 'program_enabled',
+                    'provision_enabled', 'test_enabled')
+
 # Load the GridCell KV layout
 Builder.load_file('gridcell.kv')
 
 
+class SpinnerHub:
+    """Single shared 10 Hz tick that animates the spinner on every spinning GridCell.
+    
+    Cells subscribe while any of their dots are spinning; the Clock event only
+    runs while there is at least one subscriber.
+    """
+    
+    subscribers = WeakSet()
+    index = 0
+    event = None
+    
+    @classmethod
+    def subscribe(cls, cell):
+        cls.subscribers.add(cell)
+        if cls.event is None:
+            cls.event = Clock.schedule_interval(cls._tick, 0.1)
+    
+    @classmethod
+    def unsubscribe(cls, cell):
+        cls.subscribers.discard(cell)
+        if not cls.subscribers and cls.event is not None:
+            cls.event.cancel()
+            cls.event = None
+    
+    @classmethod
+    def _tick(cls, dt):
+        cls.index = (cls.index + 1) % len(SPINNER_FRAMES)
+        frame = SPINNER_FRAMES[cls.index]
+        for cell in list(cls.subscribers):
+            cell._apply_spinner_frame(frame)
+
+
 class GridCell(ButtonBehavior, BoxLayout):
     """A custom grid cell button that toggles on long-press, shows details on tap.
     
@@ -39,13 +105,13 @@ class GridCell(ButtonBehavior, BoxLayout):
     # Basic properties
     cell_label = StringProperty("")
     cell_checked = BooleanProperty(True)
-    cell_bg_color = ListProperty([0.5, 0.5, 0.5, 1])  # Default mid-gray (ON)
-    cell_label_color = ListProperty([1, 1, 1, 1])  # Default white
+    cell_bg_color = ListProperty(BG_ON)  # Default mid-gray (ON)
+    cell_label_color = ListProperty(COLOR_WHITE)  # Default white
     serial_number = StringProperty("")  # Scanned serial number from QR code
     
     # Result icon (large checkmark or X)
     result_icon = StringProperty("")  # "✓" or "✗" or ""
-    result_icon_color = ListProperty([1, 1, 1, 1])  # Green for pass, red for fail
+    result_icon_color = ListProperty(COLOR_WHITE)  # Green for pass, red for fail
     
     # Status dots for each phase
     vision_dot = StringProperty("·")  # ● ○ ✗ · ◐
@@ -80,8 +146,8 @@ class GridCell(ButtonBehavior, BoxLayout):
     _program_spinning = BooleanProperty(False)
     _provision_spinning = BooleanProperty(False)
     _test_spinning = BooleanProperty(False)
-    _spinner_index = 0
-    _spinner_event = None
+    _spinner_active = False  # True while subscribed to SpinnerHub
+    _detail_popup_cb = None  # App.show_board_detail_popup, resolved on first tap
     
     def __init__(self, cell_label="", cell_checked=True, bg_color=None, on_toggle_callback=None, **kwargs):
         super().__init__(**kwargs)
@@ -91,22 +157,26 @@ class GridCell(ButtonBehavior, BoxLayout):
         self.always_release = True
         self.on_toggle_callback = on_toggle_callback  # Callback when cell is toggled
         self._pulse_anim = None
-        self._long_press_triggered = False
         self._touch_start_time = None
         
+        # Last (status, enabled) rendered per phase dot, and last result
+        # icon inputs - lets update_status skip unchanged property writes
+        self._last_dot_state = [None] * 5
+        self._dot_spinning = [False] * 5
+        self._last_result_state = None
+        self._last_board_status_rev = None
+        self._last_status_text = None
+        
+        # Batched property writes (see _batched)
+        self._batch_depth = 0
+        self._pending_changes = {}
+        
         # Bind cell_checked to update background color
         self.bind(cell_checked=self._on_cell_checked_changed)
         self.bind(is_active=self._on_active_changed)
         
-        # Bind spinning state changes to start/stop spinner
-        self.bind(_vision_spinning=self._on_spinning_changed)
-        self.bind(_contact_spinning=self._on_spinning_changed)
-        self.bind(_program_spinning=self._on_spinning_changed)
-        self.bind(_provision_spinning=self._on_spinning_changed)
-        self.bind(_test_spinning=self._on_spinning_changed)
-        
-        # Set initial background color
-        self._update_bg_color()
+        # Set initial background and label colors
+        self._apply_checked_colors()
         
         if bg_color:
             self.cell_bg_color = bg_color
@@ -116,41 +186,38 @@ class GridCell(ButtonBehavior, BoxLayout):
     # -------------------------------------------------------------------------
     
     def on_touch_down(self, touch):
-        """Handle touch down - start tracking for long press."""
+        """Handle touch down - remember when the press started."""
         if self.collide_point(*touch.pos):
-            self._touch_start_time = time.time()
-            self._long_press_triggered = False
-            # Schedule long press check
-            Clock.schedule_once(self._check_long_press, 0.5)
+            self._touch_start_time = time.monotonic()
             return True
         return super().on_touch_down(touch)
     
-    def _check_long_press(self, dt):
-        """Check if this is a long press (for skip toggle)."""
-        if self._touch_start_time is not None:
-            elapsed = time.time() - self._touch_start_time
-            if elapsed >= 0.5:
-                self._long_press_triggered = True
-                # Toggle skip state
-                self.cell_checked = not self.cell_checked
-    
     def on_touch_up(self, touch):
-        """Handle touch up - show details on tap, skip already handled by long press."""
+        """Handle touch up - toggle skip on long press, show details on tap."""
         if self.collide_point(*touch.pos):
-            Clock.unschedule(self._check_long_press)
-            if not self._long_press_triggered and self._touch_start_time is not None:
-                # Short tap - show detail popup
-                self._show_detail_popup()
+            if self._touch_start_time is not None:
+                if time.monotonic() - self._touch_start_time >= LONG_PRESS_TIME:
+                    # Long press - toggle skip state
+                    self.cell_checked = not self.cell_checked
+                else:
+                    # Short tap - show detail popup
+                    self._show_detail_popup()
             self._touch_start_time = None
             return True
         return super().on_touch_up(touch)
     
     def _show_detail_popup(self):
         """Show the board detail popup."""
-        from kivy.app import App
-        app = App.get_running_app()
-        if app and hasattr(app, 'show_board_detail_popup'):
-            app.show_board_detail_popup(self)
+        callback = GridCell._detail_popup_cb
+        if callback is None:
+            # Resolve the app's handler once and share it across all cells
+            from kivy.app import App
+            app = App.get_running_app()
+            callback = getattr(app, 'show_board_detail_popup', None)
+            if callback is None:
+                return
+            GridCell._detail_popup_cb = callback
+        callback(self)
     
     def on_press(self):
         """Override - we handle press in on_touch_down/up now."""
@@ -192,14 +259,9 @@ class GridCell(ButtonBehavior, BoxLayout):
     def _on_cell_checked_changed(self, instance, value):
         """Update background color and label when cell_checked changes."""
         # Skip if in batch update mode
-        if getattr(self, '_batch_update', False):
+        if self._batch_depth:
             return
-        self._update_bg_color()
-        # Update label color based on checked state
-        if self.cell_checked:
-            self.cell_label_color = [1, 1, 1, 1]  # White when enabled
-        else:
-            self.cell_label_color = [0.4, 0.4, 0.4, 1]  # Dark gray when skipped
+        self._apply_checked_colors()
         # Call the callback if provided
         if self.on_toggle_callback:
             self.on_toggle_callback()
@@ -209,22 +271,102 @@ class GridCell(ButtonBehavior, BoxLayout):
         
         Use this for bulk operations to avoid per-cell redraws and settings saves.
         """
-        self._batch_update = True
-        self.cell_checked = checked
-        if bg_color is not None:
-            self.cell_bg_color = bg_color
-        if label is not None:
-            self.cell_label = label
-        self._batch_update = False
+        with self._batched():
+            self._set('cell_checked', checked)
+            if bg_color is not None:
+                self._set('cell_bg_color', bg_color)
+            if label is not None:
+                self._set('cell_label', label)
+    
+    def reset_status(self, checked):
+        """Reset the cell to its just-loaded state as one batch.
+        
+        Clears the dots, serial number, failure reason and result icon,
+        stops animations, and applies the checked (or skipped) appearance.
+        Properties already at their reset value are not rewritten, so
+        resetting an idle grid dispatches next to nothing.
+        
+        Args:
+            checked: False if the board is in the skip list
+        """
+        # Stop any running animations
+        self._stop_spinner()
+        self._stop_pulse()
+        
+        with self._batched():
+            for name in _DOT_PROPS:
+                self._set(name, DOT_DISABLED)
+            self._set('serial_number', "")
+            self._set('failure_reason', "")
+            self._set('result_icon', "")
+            self._set('result_icon_color', COLOR_WHITE)
+            self.clear_status_text()
+            self.set_state_batch(checked, BG_ON if checked else BG_OFF, self.base_cell_label)
+        self.clear_status_cache()
+    
+    def clear_status_text(self):
+        """Blank the compatibility status lines; unchanged lines are not rewritten."""
+        with self._batched():
+            for name in _STATUS_LINE_PROPS:
+                self._set(name, "")
+        self._last_status_text = None
+    
+    def set_phase_flags(self, flags):
+        """Set the per-phase enabled flags in one batch.
+        
+        Args:
+            flags: Booleans as (vision, contact, program, provision, test)
+        
+        Only flags that actually changed are written, so re-applying the
+        same settings to the whole grid dispatches no property events.
+        """
+        with self._batched():
+            for name, value in zip(PHASE_FLAG_PROPS, flags):
+                self._set(name, value)
+    
+    @contextmanager
+    def _batched(self):
+        """Collect property writes made via _set() and apply them once at the end.
+        
+        Nested batches apply when the outermost one exits. Each property is
+        written at most once, and only if its value actually changed. Writes
+        are applied while still in batch mode, so _on_cell_checked_changed
+        stays quiet.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            if self._batch_depth == 1:
+                pending, self._pending_changes = self._pending_changes, {}
+                try:
+                    for name, value in pending.items():
+                        if getattr(self, name) != value:
+                            setattr(self, name, value)
+                finally:
+                    self._batch_depth = 0
+            else:
+                self._batch_depth -= 1
+    
+    def _set(self, name, value):
+        """Set a property, deferring to the end of the current batch if any."""
+        if self._batch_depth:
+            self._pending_changes[name] = value
+        elif getattr(self, name) != value:
+            setattr(self, name, value)
     
-    def _update_bg_color(self):
-        """Set background color based on cell_checked state."""
+    def _apply_checked_colors(self):
+        """Set background and label colors from the cell_checked state.
+        
+        Mid-gray background and white label when ON, black background and
+        dark gray label when skipped. Unchanged colors are not rewritten.
+        """
         if self.cell_checked:
-            # Mid-gray when ON
-            self.cell_bg_color = [0.5, 0.5, 0.5, 1]
+            self._set('cell_bg_color', BG_ON)
+            self._set('cell_label_color', COLOR_WHITE)
         else:
-            # Black when OFF
-            self.cell_bg_color = [0, 0, 0, 1]
+            self._set('cell_bg_color', BG_OFF)
+            self._set('cell_label_color', COLOR_DIM)
     
     # -------------------------------------------------------------------------
     # Status update from BoardStatus
@@ -236,35 +378,49 @@ class GridCell(ButtonBehavior, BoxLayout):
         Args:
             board_status: BoardStatus instance with probe, program, provision, and test status
         """
+        # Nothing to do if the BoardStatus hasn't changed since the last update
+        rev = getattr(board_status, 'rev', None)
+        if rev is not None and rev == self._last_board_status_rev:
+            return
+        self._last_board_status_rev = rev
+        
         try:
-            # Keep old status lines for compatibility
-            status_line1, status_line2, status_line3, status_line4 = board_status.status_text
-            self.status_line1 = status_line1
-            self.status_line2 = status_line2
-            self.status_line3 = status_line3
-            self.status_line4 = status_line4
-            
-            # Update serial number display based on vision status
-            if board_status.board_info and board_status.board_info.serial_number:
-                self.serial_number = board_status.board_info.serial_number
-            elif board_status.vision_status.name == "FAILED":
-                self.serial_number = "FAIL"
-            elif board_status.vision_status.name in ("IN_PROGRESS", "IDLE"):
-                self.serial_number = ""
-            else:
-                self.serial_number = ""
-            
-            # Update status dots
-            self._update_dots(board_status)
-            
-            # Update result icon
-            self._update_result_icon(board_status)
-            
-            # Update is_active for pulsing animation (use centralized function)
-            self.is_active = is_processing(board_status)
+            # Read each phase's status enum once and hand them to the helpers
+            statuses = (
+                board_status.vision_status,
+                board_status.probe_status,
+                board_status.program_status,
+                board_status.provision_status,
+                board_status.test_status,
+            )
+            vision = statuses[0]
             
-            # Update background color based on status (use centralized function)
-            self.cell_bg_color = get_status_bg_color(board_status)
+            with self._batched():
+                # Keep old status lines for compatibility
+                status_text = board_status.status_text
+                if status_text != self._last_status_text:
+                    self._last_status_text = status_text
+                    for name, line in zip(_STATUS_LINE_PROPS, status_text):
+                        self._set(name, line)
+                
+                # Update serial number display based on vision status
+                board_info = board_status.board_info
+                serial_number = board_info.serial_number if board_info else None
+                if not serial_number:
+                    serial_number = "FAIL" if vision is VisionStatus.FAILED else ""
+                self._set('serial_number', serial_number)
+                
+                # Update status dots
+                self._update_dots(statuses)
+                
+                # Update result icon
+                self._update_result_icon(statuses, board_status.failure_reason)
+                
+                # Update is_active for pulsing animation (use centralized function)
+                self._set('is_active', is_processing(board_status))
+                
+                # Update background color based on status (use centralized function)
+                self._set('cell_bg_color', get_status_bg_color(board_status))
             
         except Exception as e:
             log.error(f"[GridCell] Error updating status: {e}")
@@ -273,83 +429,84 @@ class GridCell(ButtonBehavior, BoxLayout):
     # Status dots
     # -------------------------------------------------------------------------
     
-    def _update_dots(self, board_status):
-        """Update the status dots based on board status (uses centralized status_to_dot)."""
+    def _update_dots(self, statuses):
+        """Update the status dots based on board status (uses centralized status_to_dot).
+        
+        Args:
+            statuses: Status enums as (vision, probe, program, provision, test)
+        """
+        vision, probe, program, provision, test = statuses
+        
         # Vision dot
-        dot, spinning = status_to_dot(
-            board_status.vision_status.name, 
-            self.vision_enabled,
-            self._spinner_index
-        )
-        self.vision_dot = dot
-        self._vision_spinning = spinning
+        self._update_dot(0, vision, self.vision_enabled,
+                         'vision_dot', '_vision_spinning')
         
         # Contact dot (probe phase)
-        dot, spinning = status_to_dot(
-            board_status.probe_status.name, 
-            self.contact_enabled,
-            self._spinner_index
-        )
-        self.contact_dot = dot
-        self._contact_spinning = spinning
+        self._update_dot(1, probe, self.contact_enabled,
+                         'contact_dot', '_contact_spinning')
         
         # Program dot (programming only, not probe)
-        dot, spinning = status_to_dot(
-            board_status.program_status.name, 
-            self.program_enabled,
-            self._spinner_index
-        )
-        self.program_dot = dot
-        self._program_spinning = spinning
+        self._update_dot(2, program, self.program_enabled,
+                         'program_dot', '_program_spinning')
         
         # Provision dot
-        dot, spinning = status_to_dot(
-            board_status.provision_status.name, 
-            self.provision_enabled,
-            self._spinner_index
-        )
-        self.provision_dot = dot
-        self._provision_spinning = spinning
+        self._update_dot(3, provision, self.provision_enabled,
+                         'provision_dot', '_provision_spinning')
         
         # Test dot
-        dot, spinning = status_to_dot(
-            board_status.test_status.name, 
-            self.test_enabled,
-            self._spinner_index
-        )
-        self.test_dot = dot
-        self._test_spinning = spinning
+        self._update_dot(4, test, self.test_enabled,
+                         'test_dot', '_test_spinning')
+        
+        # Start/stop the shared spinner once for the whole cell
+        if any(self._dot_spinning):
+            self._start_spinner()
+        else:
+            self._stop_spinner()
+    
+    def _update_dot(self, index, status, enabled, dot_prop, spinning_prop):
+        """Update one phase dot, skipping the property writes if unchanged.
+        
+        While a phase keeps spinning the spinner timer owns the dot symbol, so
+        an unchanged (status, enabled) pair needs no work here.
+        """
+        last = self._last_dot_state[index]
+        if last is not None and last[0] is status and last[1] == enabled:
+            return
+        self._last_dot_state[index] = (status, enabled)
+        dot, spinning = status_to_dot(status.name, enabled, SpinnerHub.index)
+        self._dot_spinning[index] = spinning
+        self._set(dot_prop, dot)
+        self._set(spinning_prop, spinning)
+    
+    def clear_status_cache(self):
+        """Forget the last rendered status so the next update_status redraws everything.
+        
+        Call this after setting dots/result icon directly (e.g. on grid reset).
+        """
+        self._last_dot_state = [None] * 5
+        self._dot_spinning = [False] * 5
+        self._last_result_state = None
+        self._last_board_status_rev = None
+        self._last_status_text = None
     
     # -------------------------------------------------------------------------
     # Spinner animation
     # -------------------------------------------------------------------------
     
-    def _on_spinning_changed(self, instance, value):
-        """Start or stop spinner animation when any dot starts/stops spinning."""
-        any_spinning = (self._vision_spinning or self._contact_spinning or 
-                       self._program_spinning or self._provision_spinning or 
-                       self._test_spinning)
-        if any_spinning and not self._spinner_event:
-            self._start_spinner()
-        elif not any_spinning and self._spinner_event:
-            self._stop_spinner()
-    
     def _start_spinner(self):
-        """Start the spinner animation timer."""
-        if not self._spinner_event:
-            self._spinner_event = Clock.schedule_interval(self._update_spinner, 0.1)
+        """Subscribe to the shared spinner tick."""
+        if not self._spinner_active:
+            self._spinner_active = True
+            SpinnerHub.subscribe(self)
     
     def _stop_spinner(self):
-        """Stop the spinner animation timer."""
-        if self._spinner_event:
-            self._spinner_event.cancel()
-            self._spinner_event = None
-    
-    def _update_spinner(self, dt):
-        """Advance spinner to next frame and update spinning dots."""
-        self._spinner_index = (self._spinner_index + 1) % len(SPINNER_FRAMES)
-        frame = SPINNER_FRAMES[self._spinner_index]
-        
+        """Unsubscribe from the shared spinner tick."""
+        if self._spinner_active:
+            self._spinner_active = False
+            SpinnerHub.unsubscribe(self)
+    
+    def _apply_spinner_frame(self, frame):
+        """Show the current spinner frame on every spinning dot."""
         if self._vision_spinning:
             self.vision_dot = frame
         if self._contact_spinning:
@@ -365,38 +522,45 @@ class GridCell(ButtonBehavior, BoxLayout):
     # Result icon
     # -------------------------------------------------------------------------
     
-    def _update_result_icon(self, board_status):
-        """Update the large result icon (checkmark or X)."""
+    def _update_result_icon(self, statuses, failure_reason):
+        """Update the large result icon (checkmark or X).
+        
+        Args:
+            statuses: Status enums as (vision, probe, program, provision, test)
+            failure_reason: BoardStatus.failure_reason (may be None)
+        """
+        vision, probe, program, provision, test = statuses
+        
         # Check if any phase failed
-        has_failure = (
-            board_status.vision_status.name == "FAILED" or
-            board_status.probe_status.name == "FAILED" or
-            board_status.program_status.name == "FAILED" or
-            board_status.provision_status.name == "FAILED" or
-            board_status.test_status.name == "FAILED"
-        )
+        has_failure = not _FAILED_STATUSES.isdisjoint(statuses)
         
         # Check if all enabled phases passed
         all_passed = True
-        if self.vision_enabled and board_status.vision_status.name not in ("PASSED", "COMPLETED"):
+        if self.vision_enabled and vision is not VisionStatus.PASSED:
             all_passed = False
-        if self.program_enabled and board_status.program_status.name not in ("COMPLETED", "IDENTIFIED"):
+        if self.program_enabled and program not in _PROGRAM_OK:
             all_passed = False
-        if self.provision_enabled and board_status.provision_status.name != "COMPLETED":
+        if self.provision_enabled and provision is not ProvisionStatus.COMPLETED:
             all_passed = False
-        if self.test_enabled and board_status.test_status.name != "COMPLETED":
+        if self.test_enabled and test is not TestStatus.COMPLETED:
             all_passed = False
         
+        failure_reason = failure_reason or ""
+        state = (has_failure, all_passed, failure_reason)
+        if state == self._last_result_state:
+            return
+        self._last_result_state = state
+        
         if has_failure:
-            self.result_icon = "✖"
-            self.result_icon_color = [1, 0.3, 0.3, 1]  # Red
+            self._set('result_icon', "✖")
+            self._set('result_icon_color', COLOR_RED)  # Red
             # Set failure reason from board status
-            self.failure_reason = board_status.failure_reason or ""
+            self._set('failure_reason', failure_reason)
         elif all_passed:
-            self.result_icon = "✔"
-            self.result_icon_color = [0.3, 1, 0.3, 1]  # Green
-            self.failure_reason = ""
+            self._set('result_icon', "✔")
+            self._set('result_icon_color', COLOR_GREEN)  # Green
+            self._set('failure_reason', "")
         else:
-            self.result_icon = ""
-            self.result_icon_color = [1, 1, 1, 1]
-            self.failure_reason = ""
+            self._set('result_icon', "")
+            self._set('result_icon_color', COLOR_WHITE)
+            self._set('failure_reason', "")
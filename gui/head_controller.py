@@ -25,15 +25,9 @@ class HeadController:
     async def connect(self):
         """Connect to head controller if not already connected."""
         # Check if existing connection is still alive
-        if self.device is not None:
-            try:
-                # Quick health check - see if reader/writer still exist
-                if self.device.reader is None or self.device.writer is None or self.device.writer.is_closing():
-                    log.info(f"[HeadController] Connection dead, reconnecting to {self.port}")
-                    self.device = None
-            except Exception as e:
-                log.info(f"[HeadController] Health check failed: {e}, reconnecting")
-                self.device = None
+        if self.device is not None and not self.device.is_alive():
+            log.info(f"[HeadController] Connection dead, reconnecting to {self.port}")
+            self.device = None
         
         if self.device is None:
             log.info(f"[HeadController] Connecting to {self.port} at {self.baudrate} baud...")
@@ -45,33 +39,64 @@ class HeadController:
     
     async def check_contact(self):
         """Check if probe is in contact with device."""
-        await self.connect()
-        log.info(f"[HeadController] Sending 'Stat' command...")
-        response = await self.device.send_command("Stat", retries=3)
-        log.info(f"[HeadController] Received response: '{response}'")
-        if 'ERROR' in response:
-            raise RuntimeError("proghead error")
-        contacted = 'PRESENT' in response
+        contacted = await self._send_stat()
         log.info(f"contacted = {contacted}")
         return contacted
 
     async def set_power(self, enable):
         """Enable or disable programmer power."""
-        await self.connect()
-        response = await self.device.send_command("PowerOn" if enable else "PowerOff", retries=3)
-        if not 'OK' in response:
-            raise RuntimeError("proghead error powering on/off")
+        await (self._send_power_on() if enable else self._send_power_off())
  
     async def set_logic(self, enable):
         """Enable or disable programmer logic."""
-        await self.connect()
-        response = await self.device.send_command("LogicOn" if enable else "LogicOff", retries=3)
-        if not 'OK' in response:
-            raise RuntimeError("proghead error logic on/off")
+        await (self._send_logic_on() if enable else self._send_logic_off())
 
     async def set_all(self, enable):
         """Enable or disable all programmer outputs."""
+        await (self._send_all_on() if enable else self._send_all_off())
+
+
+def _make_command(command, parse):
+    """Build a HeadController method that sends one fixed proghead command.
+    
+    The command bytes are encoded once here, and ``parse`` turns the response
+    line into the method's return value (raising RuntimeError on errors).
+    """
+    data = f"{command}\n".encode('ascii')
+    
+    async def send(self):
         await self.connect()
-        response = await self.device.send_command("AllOn" if enable else "AllOff", retries=3)
-        if not 'OK' in response:
-            raise RuntimeError("proghead error all on/off")
+        response = await self.device.send_command_raw(data, retries=3)
+        log.debug(f"[HeadController] {command} -> '{response}'")
+        return parse(response)
+    
+    send.__name__ = f"_send_{command}"
+    return send
+
+
+def _parse_stat(response):
+    if 'ERROR' in response:
+        raise RuntimeError("proghead error")
+    return 'PRESENT' in response
+
+
+def _expect_ok(error):
+    def parse(response):
+        if 'OK' not in response:
+            raise RuntimeError(error)
+        return response
+    return parse
+
+
+# The proghead command set is fixed, so generate one method per command
+for _name, _command, _parse in (
+    ('_send_stat', 'Stat', _parse_stat),
+    ('_send_power_on', 'PowerOn', _expect_ok("proghead error powering on/off")),
+    ('_send_power_off', 'PowerOff', _expect_ok("proghead error powering on/off")),
+    ('_send_logic_on', 'LogicOn', _expect_ok("proghead error logic on/off")),
+    ('_send_logic_off', 'LogicOff', _expect_ok("proghead error logic on/off")),
+    ('_send_all_on', 'AllOn', _expect_ok("proghead error all on/off")),
+    ('_send_all_off', 'AllOff', _expect_ok("proghead error all on/off")),
+):
+    setattr(HeadController, _name, _make_command(_command, _parse))
+del _name, _command, _parse
@@ -7,9 +7,17 @@ This module provides a reusable mixin class that adds XY jogging functionality
 to dialog controllers. Used by Panel Setup (Vision tab) and Config Settings (Camera tab).
 """
 import asyncio
+import logging
+import time
 from kivy.clock import Clock
 
 
+# Jog presses arriving within this window are combined into one move
+JOG_COALESCE_TIME = 0.03
+
+# Position queries younger than this are reused by the capture methods
+POSITION_CACHE_TTL = 0.05
+
 
 class JoggingMixin:
     """Mixin providing XY jogging controls for dialog controllers.
@@ -32,21 +40,118 @@ class JoggingMixin:
         """Initialize jogging state variables. Call from __init__."""
         self._jog_xy_step = 5.0
         self._jog_widget_prefix = 'cs'  # Default prefix, can be overridden
+        self._jog_cached_popup = None
+        self._jog_cached_labels = None
+        self._jog_pending = {'x': 0.0, 'y': 0.0}
+        self._jog_dispatch_event = None
+        self._pos_cache = None
+        self._pos_cache_t = 0.0
+        self._jog_task = None
+        self._refresh_task = None
+        self._capture_task = None
+        self._jog_widget_ids = None
+        self._jog_widget_ids = self._get_jogging_widget_ids()
+    
+    def set_jog_widget_prefix(self, prefix):
+        """Set the widget ID prefix and drop the cached IDs and widgets.
+        
+        Args:
+            prefix: Widget ID prefix (e.g. 'cs')
+        """
+        self._jog_widget_prefix = prefix
+        self._jog_widget_ids = None
+        self._jog_cached_popup = None
+        self._jog_cached_labels = None
     
     def _get_jogging_widget_ids(self):
         """Get widget IDs for jogging controls.
         
-        Override to customize widget ID prefix.
+        The mapping is built once per prefix; use set_jog_widget_prefix()
+        to change the prefix.
         
         Returns:
             dict: Mapping of widget roles to widget IDs
         """
-        prefix = getattr(self, '_jog_widget_prefix', 'cs')
-        return {
-            'pos_x': f'{prefix}_jog_pos_x',
-            'pos_y': f'{prefix}_jog_pos_y',
-            'status': f'{prefix}_jog_status',
-        }
+        widget_ids = getattr(self, '_jog_widget_ids', None)
+        if widget_ids is None:
+            prefix = getattr(self, '_jog_widget_prefix', 'cs')
+            widget_ids = {
+                'pos_x': f'{prefix}_jog_pos_x',
+                'pos_y': f'{prefix}_jog_pos_y',
+                'status': f'{prefix}_jog_status',
+            }
+            self._jog_widget_ids = widget_ids
+        return widget_ids
+    
+    def _resolve_jog_labels(self):
+        """Return the (pos_x, pos_y) label widgets, resolving them once per popup.
+        
+        Returns:
+            tuple: (x_label, y_label), either of which may be None
+        """
+        popup = self.popup
+        if popup is not self._jog_cached_popup:
+            widget_ids = self._get_jogging_widget_ids()
+            self._jog_cached_labels = (
+                popup.ids.get(widget_ids['pos_x']),
+                popup.ids.get(widget_ids['pos_y']),
+            )
+            self._jog_cached_popup = popup
+        return self._jog_cached_labels
+    
+    def _has_jog_labels(self):
+        """Return True if the current popup shows any jog position label."""
+        if not self.popup:
+            return False
+        x_label, y_label = self._resolve_jog_labels()
+        return x_label is not None or y_label is not None
+    
+    def _update_jog_labels(self, x, y):
+        """Show the given position in the jog position labels."""
+        if not self._has_jog_labels():
+            return
+        x_label, y_label = self._jog_cached_labels
+        if x_label:
+            x_label.text = "X: %.2f" % x
+        if y_label:
+            y_label.text = "Y: %.2f" % y
+    
+    def _start_jog_task(self, attr, coro, cancel_previous=False):
+        """Run a jogging coroutine as a task and keep a reference to it.
+        
+        Args:
+            attr: Name of the attribute holding the task (e.g. '_refresh_task')
+            coro: Coroutine to run
+            cancel_previous: Cancel the previous task stored in attr if it
+                             is still running (used for position refreshes,
+                             where only the latest result matters)
+        
+        Returns:
+            asyncio.Task: The new task
+        """
+        previous = getattr(self, attr)
+        if cancel_previous and previous is not None and not previous.done():
+            previous.cancel()
+        task = asyncio.create_task(coro)
+        setattr(self, attr, task)
+        return task
+    
+    async def _cached_get_position(self, max_age=POSITION_CACHE_TTL):
+        """Query the machine XY position, reusing a recent result.
+        
+        Args:
+            max_age: Maximum age in seconds of a cached position to reuse;
+                     pass 0 to always query the controller
+        
+        Returns:
+            tuple: (x, y) position
+        """
+        if self._pos_cache is not None and time.monotonic() - self._pos_cache_t < max_age:
+            return self._pos_cache
+        pos = await self.bot.motion.get_position()
+        self._pos_cache = (pos['x'], pos['y'])
+        self._pos_cache_t = time.monotonic()
+        return self._pos_cache
     
     def set_jog_xy_step(self, step):
         """Set XY jog step size.
@@ -55,66 +160,73 @@ class JoggingMixin:
             step: Step size in mm (0.1, 0.2, 0.5, 1, 5, 10, 20)
         """
         self._jog_xy_step = step
-        log.debug(f"[JoggingMixin] XY step set to {step} mm")
+        log.debug("[JoggingMixin] XY step set to %s mm", step)
     
     def jog_xy(self, axis, direction):
         """Jog the machine in the specified axis and direction.
         
+        Presses that arrive within JOG_COALESCE_TIME of each other are
+        accumulated and sent as a single relative move.
+        
         Args:
             axis: 'x' or 'y'
             direction: 1 for positive, -1 for negative
         """
+        if axis not in self._jog_pending:
+            return
+        self._jog_pending[axis] += self._jog_xy_step * direction
+        if self._jog_dispatch_event is None:
+            self._jog_dispatch_event = Clock.schedule_once(self._dispatch_jog, JOG_COALESCE_TIME)
+    
+    def _dispatch_jog(self, dt):
+        """Send the accumulated jog distance as one relative move."""
+        self._jog_dispatch_event = None
+        dx, dy = self._jog_pending['x'], self._jog_pending['y']
+        self._jog_pending['x'] = self._jog_pending['y'] = 0.0
+        if not dx and not dy:
+            return
+        self._pos_cache = None
+        
         async def do_jog():
             try:
                 if not self.bot or not self.bot.motion:
                     log.debug("[JoggingMixin] No motion controller available")
                     return
                 
-                step = self._jog_xy_step
-                if axis == 'x':
-                    await self.bot.motion.rapid_xy_rel(step * direction, 0)
-                elif axis == 'y':
-                    await self.bot.motion.rapid_xy_rel(0, step * direction)
-                
-                # Wait for motion to complete
-                await self.bot.motion.send_gcode_wait_ok("M400")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("[JoggingMixin] Jog by X=%s, Y=%s mm", dx, dy)
+                # rapid_xy_rel() already waits for the move with M400
+                await self.bot.motion.rapid_xy_rel(dx, dy)
                 
                 # Update position display
                 self._refresh_jog_position()
                 
             except Exception as e:
-                log.debug(f"[JoggingMixin] Jog error: {e}")
+                log.debug("[JoggingMixin] Jog error: %s", e)
         
-        asyncio.ensure_future(do_jog())
+        self._start_jog_task('_jog_task', do_jog())
     
     def _refresh_jog_position(self):
         """Refresh and display current machine position."""
+        if not self._has_jog_labels():
+            return
+        
         async def do_refresh():
             try:
                 if not self.bot or not self.bot.motion:
                     return
                 
-                pos = await self.bot.motion.get_position()
-                x, y = pos['x'], pos['y']
-                
-                log.debug(f"[JoggingMixin] Position: X={x:.2f}, Y={y:.2f}")
+                x, y = await self._cached_get_position(max_age=0)
                 
-                # Update position labels
-                def update_labels(dt, x=x, y=y):
-                    if not self.popup:
-                        return
-                    widget_ids = self._get_jogging_widget_ids()
-                    if x_label := self.popup.ids.get(widget_ids['pos_x']):
-                        x_label.text = f"X: {x:.2f}"
-                    if y_label := self.popup.ids.get(widget_ids['pos_y']):
-                        y_label.text = f"Y: {y:.2f}"
+                log.debug("[JoggingMixin] Position: X=%.2f, Y=%.2f", x, y)
                 
-                Clock.schedule_once(update_labels, 0)
+                # Coroutines run on the Kivy event loop thread, so update directly
+                self._update_jog_labels(x, y)
                 
             except Exception as e:
-                log.debug(f"[JoggingMixin] Position refresh error: {e}")
+                log.debug("[JoggingMixin] Position refresh error: %s", e)
         
-        asyncio.ensure_future(do_refresh())
+        self._start_jog_task('_refresh_task', do_refresh(), cancel_previous=True)
     
     def capture_current_position(self):
         """Capture current machine position and return it.
@@ -130,16 +242,15 @@ class JoggingMixin:
                     log.debug("[JoggingMixin] No motion controller for capture")
                     return None
                 
-                pos = await self.bot.motion.get_position()
-                x, y = pos['x'], pos['y']
-                log.debug(f"[JoggingMixin] Captured position: X={x:.2f}, Y={y:.2f}")
+                x, y = await self._cached_get_position()
+                log.debug("[JoggingMixin] Captured position: X=%.2f, Y=%.2f", x, y)
                 return (x, y)
                 
             except Exception as e:
-                log.debug(f"[JoggingMixin] Capture error: {e}")
+                log.debug("[JoggingMixin] Capture error: %s", e)
                 return None
         
-        return asyncio.ensure_future(do_capture())
+        return self._start_jog_task('_capture_task', do_capture())
     
     def capture_camera_offset(self):
         """Capture current position as camera offset.
@@ -159,21 +270,17 @@ class JoggingMixin:
                     log.debug("[JoggingMixin] No motion controller for offset capture")
                     return
                 
-                pos = await self.bot.motion.get_position()
-                offset_x, offset_y = pos['x'], pos['y']
-                
-                log.debug(f"[JoggingMixin] Camera offset captured: X={offset_x:.2f}, Y={offset_y:.2f}")
+                offset_x, offset_y = await self._cached_get_position()
                 
-                # Call the handler on main thread
-                def call_handler(dt, x=offset_x, y=offset_y):
-                    self._on_camera_offset_captured(x, y)
+                log.debug("[JoggingMixin] Camera offset captured: X=%.2f, Y=%.2f", offset_x, offset_y)
                 
-                Clock.schedule_once(call_handler, 0)
+                # Already on the Kivy event loop thread (async_run)
+                self._on_camera_offset_captured(offset_x, offset_y)
                 
             except Exception as e:
-                log.debug(f"[JoggingMixin] Offset capture error: {e}")
+                log.debug("[JoggingMixin] Offset capture error: %s", e)
         
-        asyncio.ensure_future(do_capture())
+        self._start_jog_task('_capture_task', do_capture())
     
     def _on_camera_offset_captured(self, offset_x, offset_y):
         """Handle captured camera offset.
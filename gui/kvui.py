@@ -1,5 +1,6 @@
 import os
 import time
+import logging
 os.environ['KCFG_INPUT_MOUSE'] = 'mouse,disable_on_activity'
 
 # Initialize logging FIRST before any other imports that might log
@@ -9,24 +10,31 @@ log = get_logger(__name__)
 
 def dump_diagnostics(label=""):
     """Dump system diagnostics to debug log."""
-    import asyncio
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        log.debug("[DIAG %s] No running event loop", label)
+        return
     try:
-        loop = asyncio.get_event_loop()
-        tasks = asyncio.all_tasks(loop)
+        tasks = asyncio.all_tasks()
         pending = [t for t in tasks if not t.done()]
-        log.debug(f"[DIAG {label}] Asyncio tasks: {len(tasks)} total, {len(pending)} pending")
+        log.debug("[DIAG %s] Asyncio tasks: %d total, %d pending", label, len(tasks), len(pending))
         for t in pending[:10]:  # Log first 10 pending tasks
-            log.debug(f"[DIAG {label}]   Task: {t.get_name()} - {t.get_coro().__qualname__ if t.get_coro() else 'no coro'}")
+            coro = t.get_coro()
+            log.debug("[DIAG %s]   Task: %s - %s", label, t.get_name(),
+                      coro.__qualname__ if coro else 'no coro')
     except Exception as e:
-        log.debug(f"[DIAG {label}] Error getting tasks: {e}")
+        log.debug("[DIAG %s] Error getting tasks: %s", label, e)
     
     try:
         from kivy.clock import Clock
         # Count scheduled events
         events = Clock.get_events()
-        log.debug(f"[DIAG {label}] Clock events scheduled: {len(events)}")
+        log.debug("[DIAG %s] Clock events scheduled: %d", label, len(events))
     except Exception as e:
-        log.debug(f"[DIAG {label}] Error getting clock events: {e}")
+        log.debug("[DIAG %s] Error getting clock events: %s", label, e)
 
 from kivy.config import Config
 
@@ -55,27 +63,45 @@ NOTO_SYMBOLS_FONT = '/usr/share/fonts/truetype/noto/NotoSansSymbols-Regular.ttf'
 NOTO_SYMBOLS2_FONT = '/usr/share/fonts/truetype/noto/NotoSansSymbols2-Regular.ttf'
 DEJAVU_SANS_FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
 
-# Try Noto Sans first (modern, looks like Roboto), with fallbacks for symbols
-if os.path.exists(NOTO_SANS_FONT):
-    log.info(f"Font: Primary font found: {NOTO_SANS_FONT}")
-    
-    # Register Noto Sans as primary font
-    LabelBase.register(name='NotoSans', fn_regular=NOTO_SANS_FONT)
-    LabelBase.register(name='Roboto', fn_regular=NOTO_SANS_FONT)
-    log.info("Font: Registered 'Roboto' (app-wide default) -> Noto Sans")
+
+def _list_font_dir(path):
+    """Return the set of file names in a font directory (empty if missing)."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+# One directory read per font family instead of a stat() per font file
+_FONT_DIR_FILES = {
+    path: _list_font_dir(path)
+    for path in {os.path.dirname(NOTO_SANS_FONT), os.path.dirname(DEJAVU_SANS_FONT)}
+}
+
+
+def _font_available(font_path):
+    """Check whether a font file exists using the cached directory listings."""
+    return os.path.basename(font_path) in _FONT_DIR_FILES.get(os.path.dirname(font_path), ())
+
+def _register_symbol_fonts(dt=None):
+    """Register the Noto symbol fonts.
     
-    # Register symbol fonts separately so Kivy can find glyphs
+    Nothing in the UI selects these by name (missing glyphs fall back to
+    system fonts), so this is deferred until after the first frame instead
+    of running during module import.
+    """
     # Note: Kivy doesn't support explicit fallback chains, but registered fonts
     # with missing glyphs will automatically fall back to system fonts
     symbol_fonts_registered = 0
-    if os.path.exists(NOTO_SYMBOLS_FONT):
+    if _font_available(NOTO_SYMBOLS_FONT):
         try:
             LabelBase.register(name='NotoSansSymbols', fn_regular=NOTO_SYMBOLS_FONT)
             log.info(f"Font: Registered symbol font 1: {NOTO_SYMBOLS_FONT}")
             symbol_fonts_registered += 1
         except Exception as e:
             log.debug(f"Font: Could not register {NOTO_SYMBOLS_FONT}: {e}")
-    if os.path.exists(NOTO_SYMBOLS2_FONT):
+    if _font_available(NOTO_SYMBOLS2_FONT):
         try:
             LabelBase.register(name='NotoSansSymbols2', fn_regular=NOTO_SYMBOLS2_FONT)
             log.info(f"Font: Registered symbol font 2: {NOTO_SYMBOLS2_FONT}")
@@ -84,19 +110,52 @@ if os.path.exists(NOTO_SANS_FONT):
             log.debug(f"Font: Could not register {NOTO_SYMBOLS2_FONT}: {e}")
     
     log.info(f"Font: Noto Sans active with {symbol_fonts_registered} symbol fonts available")
+
+
+def _register_primary_font():
+    """Register the app-wide default font ('Roboto').
     
-elif os.path.exists(DEJAVU_SANS_FONT):
-    # Fallback to DejaVu Sans if Noto not available
-    log.info(f"Font: Primary font (Noto Sans) not found, using fallback: {DEJAVU_SANS_FONT}")
-    LabelBase.register(name='DejaVuSans', fn_regular=DEJAVU_SANS_FONT)
-    LabelBase.register(name='Roboto', fn_regular=DEJAVU_SANS_FONT)
-    log.info("Font: Registered 'Roboto' (app-wide default) -> DejaVu Sans")
-else:
-    log.warning("Font: No custom fonts found, using Kivy defaults")
+    Must run before any KV is loaded, since KV rules use the default font.
+    
+    Returns:
+        True if Noto Sans was registered (symbol fonts should follow)
+    """
+    # Try Noto Sans first (modern, looks like Roboto), with fallbacks for symbols
+    if _font_available(NOTO_SANS_FONT):
+        log.info(f"Font: Primary font found: {NOTO_SANS_FONT}")
+        
+        # Register Noto Sans as primary font
+        LabelBase.register(name='NotoSans', fn_regular=NOTO_SANS_FONT)
+        LabelBase.register(name='Roboto', fn_regular=NOTO_SANS_FONT)
+        log.info("Font: Registered 'Roboto' (app-wide default) -> Noto Sans")
+        return True
+    
+    if _font_available(DEJAVU_SANS_FONT):
+        # Fallback to DejaVu Sans if Noto not available
+        log.info(f"Font: Primary font (Noto Sans) not found, using fallback: {DEJAVU_SANS_FONT}")
+        LabelBase.register(name='DejaVuSans', fn_regular=DEJAVU_SANS_FONT)
+        LabelBase.register(name='Roboto', fn_regular=DEJAVU_SANS_FONT)
+        log.info("Font: Registered 'Roboto' (app-wide default) -> DejaVu Sans")
+    else:
+        log.warning("Font: No custom fonts found, using Kivy defaults")
+    return False
+
+
+_noto_sans_registered = _register_primary_font()
 
+import re
 import sys
 import asyncio
+from datetime import datetime
 import logging
+from collections import deque
+from functools import lru_cache, partial
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    HAS_INOTIFY = True
+except ImportError:
+    HAS_INOTIFY = False
 
 # Suppress pynnex debug/trace logging which creates significant overhead
 # Set before importing pynnex to ensure it takes effect
@@ -122,13 +181,17 @@ from kivy.properties import StringProperty, BooleanProperty, ListProperty, Numer
 from settings import get_settings
 from kivy.factory import Factory
 from kivy.uix.textinput import TextInput
+from kivy.uix.popup import Popup
+from kivy.uix.filechooser import FileChooserListView
 from kivy.logger import Logger
 from kivy.effects.scroll import ScrollEffect
 from kivy.clock import Clock
 from serial_port_selector import SerialPortSelector
-import os
 
 import sequence
+from motion_controller import MotionController
+from head_controller import HeadController
+from target_controller import TargetController
 from panel_settings import get_panel_settings, find_panel_files
 from numpad_keyboard import switch_keyboard_layout
 from panel_setup_dialog import PanelSetupController
@@ -138,15 +201,16 @@ from regex_helper import RegexHelperMixin
 from settings_handlers import SettingsHandlersMixin
 from panel_file_manager import PanelFileManagerMixin
 from board_detail_popup import BoardDetailPopup
-from gridcell import GridCell
-from board_status import DOT_DISABLED
+from gridcell import GridCell, BG_ON, BG_OFF
 from cycle_summary import CycleSummaryPopup, build_cycle_summary, FileExportHandler
 
 class OutputCapture:
     """Captures print/stderr output and routes to the logging system.
     
     This intercepts print() calls and routes them through Python logging
-    so they appear in the log file with proper formatting.
+    so they appear in the log file with proper formatting. Logging hands
+    records to the QueueListener thread (see logger.py), so a print() on the
+    UI thread never waits on file or console I/O.
     """
     def __init__(self):
         self.original_stdout = sys.__stdout__
@@ -155,10 +219,10 @@ class OutputCapture:
     
     def write(self, text):
         """Route print output to logging system."""
-        # Skip empty or whitespace-only text
-        text = text.rstrip('\n\r')
-        if not text or not text.strip():
+        # Skip empty or whitespace-only text (print() writes its newline separately)
+        if not text or text.isspace():
             return
+        text = text.rstrip('\n\r')
         # Route through logging (will go to file and console)
         self._print_logger.info(text)
     
@@ -185,6 +249,11 @@ class LogViewer(ScrollView):
     
     # Log level filter - show this level and above
     LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
+    _LEVEL_RE = re.compile(r'\[(DEBUG|INFO|WARNING|ERROR)\]')
+    _LEVEL_IDX = {level: i for i, level in enumerate(LOG_LEVELS)}
+    
+    MAX_LINES = 500  # Lines kept in memory for re-filtering
+    MAX_SHOWN = 300  # Filtered lines kept for display
     
     def __init__(self, **kwargs):
         kwargs.setdefault('effect_cls', ScrollEffect)
@@ -194,7 +263,15 @@ class LogViewer(ScrollView):
         self._file_pos = 0  # Track position in file for incremental reads
         self._is_tailing = False
         self._filter_level = 'INFO'  # Default to INFO and above
-        self._all_lines = []  # Store all lines for filtering
+        self._filter_idx = self.LOG_LEVELS.index(self._filter_level)
+        self._all_lines = deque(maxlen=self.MAX_LINES)  # Store all lines for filtering
+        self._filtered = deque(maxlen=self.MAX_SHOWN)  # Lines passing the filter
+        self._shown_count = 0  # Lines currently in the TextInput
+        self._partial = b''  # Trailing incomplete line from the last read
+        self._inotify = None  # inotify watch on the log file, when available
+        self._log_file = None  # Log file handle kept open while tailing
+        # Coalesces bursts of file change notifications into one tail read
+        self._tail_trigger = Clock.create_trigger(self._tail_update, 0.1)
         # Find log_text TextInput in children after build
         Clock.schedule_once(self._setup_log_text, 0)
 
@@ -221,27 +298,53 @@ class LogViewer(ScrollView):
         """
         if level in self.LOG_LEVELS:
             self._filter_level = level
+            self._filter_idx = self.LOG_LEVELS.index(level)
             self._apply_filter()
     
     def _should_show_line(self, line: str) -> bool:
         """Check if a log line should be shown based on current filter."""
-        filter_idx = self.LOG_LEVELS.index(self._filter_level)
-        for i, level in enumerate(self.LOG_LEVELS):
-            if f'[{level}]' in line:
-                return i >= filter_idx
+        match = self._LEVEL_RE.search(line)
         # Lines without a level marker are always shown
-        return True
+        return match is None or self._LEVEL_IDX[match.group(1)] >= self._filter_idx
     
     def _apply_filter(self):
-        """Apply the current filter to all stored lines."""
+        """Apply the current filter to all stored lines (full rebuild)."""
         if not self.log_text:
             return
-        filtered = [line for line in self._all_lines if self._should_show_line(line)]
-        # Keep last 300 filtered lines
-        if len(filtered) > 300:
-            filtered = filtered[-300:]
-        self.log_text.text = '\n'.join(filtered)
+        self._filtered.clear()
+        self._filtered.extend(line for line in self._all_lines if self._should_show_line(line))
+        self._render_filtered()
+    
+    def _render_filtered(self):
+        """Replace the TextInput contents with the filtered lines."""
+        self.log_text.text = '\n'.join(self._filtered)
+        self._shown_count = len(self._filtered)
         self.scroll_to_bottom()
+    
+    def _append_lines(self, lines):
+        """Add newly read lines, appending only the ones that pass the filter.
+        
+        The TextInput is allowed to grow to twice MAX_SHOWN before it is
+        rebuilt from the filtered deque, so most updates are a plain append.
+        """
+        self._all_lines.extend(lines)
+        shown = [line for line in lines if self._should_show_line(line)]
+        if not shown:
+            return
+        self._filtered.extend(shown)
+        if not self._shown_count or self._shown_count + len(shown) > 2 * self.MAX_SHOWN:
+            self._render_filtered()
+            return
+        self.log_text.text += '\n' + '\n'.join(shown)
+        self._shown_count += len(shown)
+        self.scroll_to_bottom()
+    
+    def _split_lines(self, data: bytes):
+        """Split newly read bytes into complete lines, holding back a partial one."""
+        data = self._partial + data
+        parts = data.split(b'\n')
+        self._partial = parts.pop()
+        return [part.decode('utf-8', errors='replace') for part in parts]
 
     def start_tailing(self):
         """Start tailing the log file (call when log viewer becomes visible)."""
@@ -252,58 +355,168 @@ class LogViewer(ScrollView):
         # Load existing content first (last 500 lines, filter to 300)
         self._load_initial_content()
         
-        # Schedule periodic tail updates
-        self._tail_event = Clock.schedule_interval(self._tail_update, 0.5)  # Update every 500ms
+        # Wake on file changes if inotify is available, otherwise poll
+        if not self._start_log_watch():
+            self._tail_event = Clock.schedule_interval(self._tail_update, 0.5)  # Update every 500ms
     
     def stop_tailing(self):
         """Stop tailing the log file (call when log viewer is hidden)."""
         self._is_tailing = False
+        self._stop_log_watch()
+        self._close_log_file()
+        self._tail_trigger.cancel()
         if self._tail_event:
             self._tail_event.cancel()
             self._tail_event = None
     
+    def _start_log_watch(self) -> bool:
+        """Watch the log file with inotify so tailing only runs when it changes.
+        
+        Returns:
+            True if the watch is active, False to fall back to polling
+        """
+        if not HAS_INOTIFY:
+            return False
+        try:
+            self._inotify = INotify()
+            self._inotify.add_watch(
+                LOG_FILE_PATH,
+                inotify_flags.MODIFY | inotify_flags.MOVE_SELF | inotify_flags.DELETE_SELF
+            )
+            asyncio.get_running_loop().add_reader(self._inotify.fileno(), self._on_log_event)
+            return True
+        except (OSError, RuntimeError) as e:
+            log.debug(f"[LogViewer] inotify unavailable, polling log file: {e}")
+            self._stop_log_watch()
+            return False
+    
+    def _stop_log_watch(self):
+        """Remove the inotify watch, if any."""
+        if self._inotify is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(self._inotify.fileno())
+        except (OSError, RuntimeError, ValueError):
+            pass
+        self._inotify.close()
+        self._inotify = None
+    
+    def _on_log_event(self):
+        """Handle inotify events for the log file."""
+        rotated = False
+        for event in self._inotify.read(timeout=0):
+            if event.mask & (inotify_flags.MOVE_SELF | inotify_flags.DELETE_SELF):
+                rotated = True
+        if rotated:
+            # RotatingFileHandler renamed the file; read what is left of the
+            # old one now; the next tail read moves on to the new file
+            self._tail_update(0)
+            self._stop_log_watch()
+            if not self._start_log_watch():
+                # The new file may not exist yet; poll until it can be watched
+                self._tail_event = Clock.schedule_interval(self._poll_until_watched, 0.5)
+        self._tail_trigger()
+    
+    def _poll_until_watched(self, dt):
+        """Poll the log file after a rollover, switching back to inotify once it can."""
+        self._tail_update(dt)
+        if self._start_log_watch():
+            self._tail_event = None
+            return False
+    
+    def _close_log_file(self):
+        """Close the tailed log file handle, if open."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+    
+    @staticmethod
+    def _read_last_lines(f, count, chunk_size=65536):
+        """Read the last `count` lines of a binary file by scanning backwards.
+        
+        Only the chunks needed to find `count` newlines are read, so large
+        log files are never loaded whole.
+        
+        Returns:
+            Tuple of (lines, end_position)
+        """
+        end = f.seek(0, 2)
+        pos = end
+        data = b''
+        while pos > 0 and data.count(b'\n') <= count:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+        lines = data.decode('utf-8', errors='replace').split('\n')
+        return lines[-count:], end
+    
     def _load_initial_content(self):
         """Load the last N lines from the log file."""
         if not self.log_text:
             return
+        self._close_log_file()
         try:
-            with open(LOG_FILE_PATH, 'r') as f:
-                # Read all and get last 500 lines
-                content = f.read()
-                lines = content.split('\n')
-                if len(lines) > 500:
-                    lines = lines[-500:]
-                self._all_lines = lines
-                # Apply filter
-                self._apply_filter()
-                # Remember file position for incremental reads
-                f.seek(0, 2)  # Seek to end
-                self._file_pos = f.tell()
+            self._log_file = open(LOG_FILE_PATH, 'rb')
+            # Get last 500 lines and remember the end for incremental reads
+            lines, self._file_pos = self._read_last_lines(self._log_file, self.MAX_LINES)
+            # The file normally ends in a newline, leaving an empty last element
+            self._partial = lines.pop().encode('utf-8') if lines else b''
+            self._all_lines.clear()
+            self._all_lines.extend(lines)
+            # Apply filter
+            self._apply_filter()
         except FileNotFoundError:
             self.log_text.text = "[Log file not found yet]\n"
-            self._all_lines = []
-            self._file_pos = 0
+            self._reset_lines()
         except Exception as e:
             self.log_text.text = f"[Error loading log: {e}]\n"
-            self._all_lines = []
-            self._file_pos = 0
+            self._reset_lines()
+    
+    def _reset_lines(self):
+        """Forget stored lines after a failed load; the next read starts at the top."""
+        self._all_lines.clear()
+        self._filtered.clear()
+        self._shown_count = 0
+        self._partial = b''
+        self._file_pos = 0
+    
+    def _log_file_replaced(self) -> bool:
+        """True if LOG_FILE_PATH now names a different file than the open handle."""
+        try:
+            path_ino = os.stat(LOG_FILE_PATH).st_ino
+        except FileNotFoundError:
+            return False  # Rolled over but the new file isn't created yet
+        return path_ino != os.fstat(self._log_file.fileno()).st_ino
     
     def _tail_update(self, dt):
         """Read new content from the log file (incremental tail)."""
         if not self.log_text or not self._is_tailing:
             return
         try:
-            with open(LOG_FILE_PATH, 'r') as f:
-                f.seek(self._file_pos)
-                new_content = f.read()
-                if new_content:
-                    new_lines = new_content.split('\n')
-                    self._all_lines.extend(new_lines)
-                    # Keep last 500 lines in memory
-                    if len(self._all_lines) > 500:
-                        self._all_lines = self._all_lines[-500:]
-                    self._file_pos = f.tell()
-                    self._apply_filter()
+            if self._log_file is None:
+                self._log_file = open(LOG_FILE_PATH, 'rb')
+                self._log_file.seek(self._file_pos)
+            # Cheap no-change probe before touching the read path
+            size = os.fstat(self._log_file.fileno()).st_size
+            if size == self._file_pos:
+                # Nothing new on this handle; follow a rollover to the new file
+                if not self._log_file_replaced():
+                    return
+                self._close_log_file()
+                self._file_pos = 0
+                self._partial = b''
+                self._log_file = open(LOG_FILE_PATH, 'rb')
+            elif size < self._file_pos:
+                # Truncated in place; start over from the top
+                self._log_file.seek(0)
+                self._file_pos = 0
+                self._partial = b''
+            # The handle keeps its position between reads
+            new_content = self._log_file.read()
+            if new_content:
+                self._file_pos = self._log_file.tell()
+                self._append_lines(self._split_lines(new_content))
         except Exception:
             pass  # Silently ignore errors during tailing
     
@@ -318,39 +531,149 @@ class LogViewer(ScrollView):
         pass
 
 
+@lru_cache(maxsize=16)
+def _grid_cell_order(rows, cols):
+    """Cell numbers in grid add order (row-major from top-left).
+    
+    GridLayout fills row-major from the top, while cells are numbered
+    column-major from the bottom-left. The result only depends on the
+    panel dimensions, so it is computed once per (rows, cols).
+    
+    Returns:
+        Tuple where item N is (cell_number, col, row_from_bottom) for the
+        cell at grid position N
+    """
+    order = [None] * (rows * cols)
+    for cell_index in range(rows * cols):
+        col, row_from_bottom = divmod(cell_index, rows)
+        row_from_top = rows - 1 - row_from_bottom
+        order[row_from_top * cols + col] = (cell_index, col, row_from_bottom)
+    return tuple(order)
+
+
+def _cast_setting(settings_data, key, cast, fallback):
+    """Read a settings value and cast it, returning fallback if the cast fails."""
+    try:
+        value = settings_data.get(key, fallback)
+        # Handle boolean strings properly (bool('False') == True is wrong!)
+        if cast is bool and isinstance(value, str):
+            return value.lower() in ('true', '1', 'yes')
+        return cast(value)
+    except Exception as e:
+        log.debug(f"[_config_from_settings] Cast failed for {key}: {e}")
+        return fallback
+
+
+# Operation mode spinner text -> sequence.OperationMode
+_MODE_MAPPING = {
+    "Identify Only": sequence.OperationMode.IDENTIFY_ONLY,
+    "Program": sequence.OperationMode.PROGRAM,
+    "Program & Test": sequence.OperationMode.PROGRAM_AND_TEST,
+    "Test Only": sequence.OperationMode.TEST_ONLY,
+}
+
+
+# Reconfigurable serial devices:
+# device type -> (controller class, bot attribute, port setting, baud config field, needs init())
+_PORT_CONFIG = {
+    "Motion Controller": (MotionController, 'motion', 'motion_port_id', 'motion_baud', True),
+    "Head Controller": (HeadController, 'head', 'head_port_id', 'head_baud', False),
+    "Target Device": (TargetController, 'target', 'target_port_id', 'target_baud', False),
+}
+
+
+def _forward_to_config_settings(method_name, doc):
+    """Build an AsyncApp.cs_* method that calls ConfigSettingsController.<method_name>."""
+    def forward(self, *args):
+        return getattr(self.config_settings_controller, method_name)(*args)
+    forward.__name__ = forward.__qualname__ = 'cs_' + method_name
+    forward.__doc__ = doc
+    return forward
+
+
+# Widgets refreshed by _apply_settings_to_widgets():
+# (widget id, settings source, key, default, widget attribute, formatter)
+# 'main' is the app settings singleton, 'panel' is the loaded panel settings dict.
+_WIDGET_SETTINGS = (
+    ('contact_adjust_step_input', 'main', 'contact_adjust_step', 0.1, 'text', lambda v: str(float(v))),
+    ('qr_scan_timeout_input', 'main', 'qr_scan_timeout', 5.0, 'text', lambda v: str(float(v))),
+    ('qr_search_offset_input', 'main', 'qr_search_offset', 2.0, 'text', lambda v: str(float(v))),
+    ('camera_offset_x_input', 'main', 'camera_offset_x', 50.0, 'text', str),
+    ('camera_offset_y_input', 'main', 'camera_offset_y', 50.0, 'text', str),
+    ('camera_rotation_spinner', 'main', 'camera_preview_rotation', 0, 'text', lambda v: f"{v}°"),
+    ('operation_spinner', 'panel', 'operation_mode', 'Program', 'text', str),
+    ('use_camera_checkbox', 'panel', 'use_camera', True, 'active', bool),
+    ('network_firmware_input', 'panel', 'network_core_firmware', '/home/steve/fw/merged_CPUNET.hex', 'text', str),
+    ('main_firmware_input', 'panel', 'main_core_firmware', '/home/steve/fw/merged.hex', 'text', str),
+)
+
+
 class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditorMixin, RegexHelperMixin, App):
     """Main application class with settings, panel file, and step editor handlers mixed in."""
     
     other_task = None
     bot_task = None
     grid_cells = {}  # Dictionary to store cells by ID for easy access
+    _cell_coords = {}  # cell ID -> (col, row_from_bottom), rebuilt with the grid
     log_popup = None
     error_popup = None
+    stats_popup = None
+    board_detail_popup = None
+    _panel_import_popup = None
+    _last_stats_text = 'Ready'  # Latest stats text, shown when the stats popup opens
     file_chooser_popup = None
     save_panel_dialog = None
     last_error_info = None
-    config_widgets = []  # List of config widgets for enable/disable
+    _stats_connected_bot = None  # Bot whose stats_updated is connected to on_stats_updated
+    config_widgets = ()  # Config widgets for enable/disable (missing ids filtered out)
+    _togglable_widgets = None  # Config widgets + grid cells, rebuilt when either changes
+    _cached_phase_flags = None  # Grid phase flags from panel settings; cleared on save/load
     bot = None  # Bot instance
     panel_settings = None
-    panel_setup_controller = None  # Panel setup dialog controller
-    config_settings_controller = None  # Config settings dialog controller
+    _panel_setup_controller = None  # Panel setup dialog controller (created on first use)
+    _config_settings_controller = None  # Config settings dialog controller (created on first use)
     provision_step_editor = None  # Provision step editor dialog controller
     main_menu_dropdown = None  # Main hamburger menu dropdown
     cycle_timer_event = None  # Clock event for cycle timer updates
     cycle_start_time = None  # Start time of current cycle
+    grid_rows = None  # Set by populate_grid
+    grid_cols = None
+    panel_grid = None  # GridLayout holding the cells, set in build()
+    phase_label = None
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Load KV file early so Factory classes are available
         kv_file = os.path.join(os.path.dirname(__file__), 'progbot.kv')
         Builder.load_file(kv_file)
-        # Initialize panel setup controller
-        self.panel_setup_controller = PanelSetupController(self)
-        # Initialize config settings controller
-        self.config_settings_controller = ConfigSettingsController(self)
+        # Settings singleton, resolved once
+        self._settings = get_settings()
+        # Starting directory for file choosers
+        self._home_dir = os.path.expanduser('~')
+        # Coalesces skip list saves from cell toggles into one write per frame
+        self._save_skip_trigger = Clock.create_trigger(self._save_skip_board_pos, 0)
+        # Bot updates arriving within one frame are applied once, latest value wins
+        self._stats_flush_trigger = Clock.create_trigger(self._flush_stats, 0)
+        self._pending_cell_updates = {}  # cell_id -> (board_status, bg_color), None = unchanged
+        self._cell_update_trigger = Clock.create_trigger(self._flush_cell_updates, 0)
+        # Panel setup and config settings controllers are created on first use
         # Initialize provision step editor controller
         self.provision_step_editor = ProvisionStepEditorController(self)
     
+    @property
+    def panel_setup_controller(self):
+        """Panel setup dialog controller, created on first access."""
+        if self._panel_setup_controller is None:
+            self._panel_setup_controller = PanelSetupController(self)
+        return self._panel_setup_controller
+    
+    @property
+    def config_settings_controller(self):
+        """Config settings dialog controller, created on first access."""
+        if self._config_settings_controller is None:
+            self._config_settings_controller = ConfigSettingsController(self)
+        return self._config_settings_controller
+    
     # ==================== Main Menu ====================
     
     def show_main_menu(self):
@@ -383,7 +706,6 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         """Open the KiKit panel import wizard as a popup."""
         try:
             from panel_import.panel_import_wizard import PanelImportWizard
-            from kivy.uix.popup import Popup
             from kivy.metrics import dp
             
             # Create wizard
@@ -412,7 +734,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         from pathlib import Path
         
         # Close the popup
-        if hasattr(self, '_panel_import_popup') and self._panel_import_popup:
+        if self._panel_import_popup:
             self._panel_import_popup.dismiss()
             self._panel_import_popup = None
         
@@ -452,7 +774,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
     
     def _on_panel_import_cancel(self):
         """Handle panel import wizard cancellation."""
-        if hasattr(self, '_panel_import_popup') and self._panel_import_popup:
+        if self._panel_import_popup:
             self._panel_import_popup.dismiss()
             self._panel_import_popup = None
     
@@ -515,7 +837,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
     def toggle_stats_popup(self):
         """Toggle the statistics popup."""
         try:
-            if not hasattr(self, 'stats_popup') or not self.stats_popup:
+            if not self.stats_popup:
                 # Create popup if it doesn't exist
                 self.stats_popup = Factory.StatsPopup()
             
@@ -524,10 +846,9 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
                 self.stats_popup.dismiss()
             else:
                 # Populate with last stats text before opening
-                if hasattr(self, '_last_stats_text'):
-                    stats_label = self.stats_popup.ids.get('stats_label')
-                    if stats_label:
-                        stats_label.text = self._last_stats_text
+                stats_label = self.stats_popup.ids.get('stats_label')
+                if stats_label:
+                    stats_label.text = self._last_stats_text
                 self.stats_popup.open()
         except Exception as e:
             log.error(f"Error toggling stats popup: {e}")
@@ -553,7 +874,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
                 return
             
             # Create popup controller if needed
-            if not hasattr(self, 'board_detail_popup') or self.board_detail_popup is None:
+            if self.board_detail_popup is None:
                 self.board_detail_popup = BoardDetailPopup(self)
             
             # Show the popup
@@ -567,11 +888,9 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
 
     def _start_cycle_timer(self):
         """Start the cycle timer display."""
-        import time
         self.cycle_start_time = time.time()
-        # Update immediately, then every second
+        # Update immediately; each update schedules the next one
         self._update_cycle_timer(0)
-        self.cycle_timer_event = Clock.schedule_interval(self._update_cycle_timer, 1.0)
     
     def _stop_cycle_timer(self):
         """Stop the cycle timer display."""
@@ -585,8 +904,11 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             timer_label.text = ""
     
     def _update_cycle_timer(self, dt):
-        """Update the cycle timer label."""
-        import time
+        """Update the cycle timer label.
+        
+        Reschedules itself just after the next whole second of elapsed time,
+        so the display neither drifts nor updates twice within one second.
+        """
         if self.cycle_start_time is None:
             return
         elapsed = time.time() - self.cycle_start_time
@@ -595,6 +917,9 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         timer_label = self.root.ids.get('cycle_timer_label')
         if timer_label:
             timer_label.text = f"{minutes}:{seconds:02d}"
+        self.cycle_timer_event = Clock.schedule_once(
+            self._update_cycle_timer, 1.0 - (elapsed % 1.0) + 0.01
+        )
 
     def _open_error_popup(self, error_info):
         message = error_info.get('message', 'Unknown error') if isinstance(error_info, dict) else str(error_info)
@@ -635,12 +960,15 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             cols: Number of columns
             labels: Optional list of labels for cells (column-major from bottom-left)
         """
-        if not (grid := getattr(self, 'panel_grid', None)):
+        if not (grid := self.panel_grid):
             log.error("Error: panel_grid not found")
             return
         
         # Clear existing cells
         grid.clear_widgets()
+        self.grid_cells = {}
+        self._cell_coords = {}
+        self._togglable_widgets = None
         
         # Set grid dimensions
         grid.cols = cols
@@ -652,7 +980,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         self.grid_cols = cols
         
         # Load skip board positions from settings
-        skip_pos = get_settings().get('skip_board_pos', [])
+        skip_pos = self._settings.get('skip_board_pos', [])
         
         # Create mapping from grid add order (row-major from top) to cell number (column-major from bottom-left)
         # For cell number i (column-major, bottom-left = 0):
@@ -661,43 +989,39 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         # - row_from_top = rows - 1 - row_from_bottom
         # - grid_position = row_from_top * cols + col
         
-        cell_mapping = {}
-        for cell_index in range(rows * cols):
-            col = cell_index // rows
-            row_from_bottom = cell_index % rows
-            row_from_top = rows - 1 - row_from_bottom
-            grid_position = row_from_top * cols + col
-            cell_mapping[grid_position] = cell_index
+        skip_set = {tuple(pos) for pos in skip_pos}
         
         # Add cells in grid position order
-        for grid_position in range(rows * cols):
-            cell_index = cell_mapping[grid_position]
+        for cell_index, col, row_from_bottom in _grid_cell_order(rows, cols):
             label_text = labels[cell_index] if labels and cell_index < len(labels) else str(cell_index)
             
-            # Convert cell index to [col, row] to check if it's in skip list
-            col = cell_index // rows
-            row_from_bottom = cell_index % rows
-            is_skipped = [col, row_from_bottom] in skip_pos
-            
-            # Create callback for this cell
-            def make_callback():
-                """Create a closure to capture current state."""
-                def on_toggle():
-                    skip_pos_updated = self.get_skip_board_pos()
-                    get_settings().set('skip_board_pos', skip_pos_updated)
-                    log.debug(f"[GridCell] Saved skip_board_pos: {skip_pos_updated}")
-                return on_toggle
+            # [col, row] position is precomputed with the order; check the skip list
+            is_skipped = (col, row_from_bottom) in skip_set
             
-            # Create cell with appropriate checked state and callback
-            cell = GridCell(cell_label=label_text, cell_checked=not is_skipped, on_toggle_callback=make_callback())
+            # Create cell with appropriate checked state and the shared toggle handler
+            cell = GridCell(cell_label=label_text, cell_checked=not is_skipped, on_toggle_callback=self._on_cell_toggle)
             
             grid.add_widget(cell)            
-            # Store cell reference by ID
+            # Store cell reference and its (col, row_from_bottom) by ID
             self.grid_cells[cell_index] = cell
+            self._cell_coords[cell_index] = (col, row_from_bottom)
         
         # Update grid cells with current phase enabled states
         self.update_grid_phase_states()
     
+    def _on_cell_toggle(self):
+        """Schedule saving the skip list after any grid cell is toggled (shared by all cells).
+        
+        Toggles within the same frame are coalesced into a single settings write.
+        """
+        self._save_skip_trigger()
+    
+    def _save_skip_board_pos(self, dt=None):
+        """Persist the current skip list to settings."""
+        skip_pos_updated = self.get_skip_board_pos()
+        self._settings.set('skip_board_pos', skip_pos_updated)
+        log.debug(f"[GridCell] Saved skip_board_pos: {skip_pos_updated}")
+    
     def get_skip_board_pos(self):
         """Get list of unchecked board positions in [col, row] format.
         
@@ -706,18 +1030,12 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         Returns:
             List of [col, row] coordinates for unchecked cells
         """
-        skip_positions = []
-        for cell_id, cell in self.grid_cells.items():
-            # If checkbox is NOT checked, add to skip list
-            if not cell.cell_checked:
-                # Convert from column-major ID to [col, row]
-                # cell_id is column-major from bottom-left:
-                # col = cell_id // grid_rows
-                # row_from_bottom = cell_id % grid_rows
-                col = cell_id // self.grid_rows
-                row_from_bottom = cell_id % self.grid_rows
-                skip_positions.append([col, row_from_bottom])
-        return skip_positions
+        coords = self._cell_coords
+        return [
+            list(coords[cell_id])
+            for cell_id, cell in self.grid_cells.items()
+            if not cell.cell_checked
+        ]
     
     # Settings handlers (on_board_cols_change, on_board_rows_change, etc.)
     # are provided by SettingsHandlersMixin
@@ -726,52 +1044,25 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
 
     def open_network_firmware_chooser(self):
         """Open file chooser to select network core firmware."""
-        from kivy.uix.filechooser import FileChooserListView
-        from kivy.uix.popup import Popup
-        from kivy.uix.boxlayout import BoxLayout
-        from kivy.uix.button import Button
-        
-        layout = BoxLayout(orientation='vertical')
-        chooser = FileChooserListView(
-            path=os.path.expanduser('~'),
-            filters=['*.hex']
-        )
-        layout.add_widget(chooser)
-        
-        button_layout = BoxLayout(size_hint_y=0.1, spacing=5)
-        select_btn = Button(text='Select')
-        cancel_btn = Button(text='Cancel')
-        button_layout.add_widget(select_btn)
-        button_layout.add_widget(cancel_btn)
-        layout.add_widget(button_layout)
-        
-        popup = Popup(title='Select Network Core Firmware', content=layout, size_hint=(0.8, 0.8))
-        
-        def on_select(instance):
-            if chooser.selection:
-                path = chooser.selection[0]
-                if network_input := self.root.ids.get('network_firmware_input'):
-                    network_input.text = path
-                self.on_network_firmware_change(path)
-                popup.dismiss()
-        
-        def on_cancel(instance):
-            popup.dismiss()
-        
-        select_btn.bind(on_press=on_select)
-        cancel_btn.bind(on_press=on_cancel)
-        popup.open()
+        self._open_firmware_chooser('Select Network Core Firmware', 'network_firmware_input',
+                                    self.on_network_firmware_change)
 
     def open_main_firmware_chooser(self):
         """Open file chooser to select main core firmware."""
-        from kivy.uix.filechooser import FileChooserListView
-        from kivy.uix.popup import Popup
-        from kivy.uix.boxlayout import BoxLayout
-        from kivy.uix.button import Button
+        self._open_firmware_chooser('Select Main Core Firmware', 'main_firmware_input',
+                                    self.on_main_firmware_change)
+
+    def _open_firmware_chooser(self, title, input_id, on_change):
+        """Open a .hex file chooser popup.
         
+        Args:
+            title: Popup title
+            input_id: ID of the TextInput that shows the selected path
+            on_change: Settings handler called with the selected path
+        """
         layout = BoxLayout(orientation='vertical')
         chooser = FileChooserListView(
-            path=os.path.expanduser('~'),
+            path=self._home_dir,
             filters=['*.hex']
         )
         layout.add_widget(chooser)
@@ -783,24 +1074,26 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         button_layout.add_widget(cancel_btn)
         layout.add_widget(button_layout)
         
-        popup = Popup(title='Select Main Core Firmware', content=layout, size_hint=(0.8, 0.8))
-        
-        def on_select(instance):
-            if chooser.selection:
-                path = chooser.selection[0]
-                if main_input := self.root.ids.get('main_firmware_input'):
-                    main_input.text = path
-                self.on_main_firmware_change(path)
-                popup.dismiss()
-        
-        def on_cancel(instance):
-            popup.dismiss()
+        popup = Popup(title=title, content=layout, size_hint=(0.8, 0.8))
         
-        select_btn.bind(on_press=on_select)
-        cancel_btn.bind(on_press=on_cancel)
+        select_btn.bind(on_press=partial(self._on_firmware_chosen, chooser, input_id, on_change, popup))
+        cancel_btn.bind(on_press=lambda instance: popup.dismiss())
         popup.open()
+
+    def _on_firmware_chosen(self, chooser, input_id, on_change, popup, instance):
+        """Apply the file selected in a firmware chooser popup."""
+        if chooser.selection:
+            path = chooser.selection[0]
+            if path_input := self.root.ids.get(input_id):
+                path_input.text = path
+            on_change(path)
+            popup.dismiss()
     
     def build(self):
+        # Symbol fonts aren't needed to draw the first frame
+        if _noto_sans_registered:
+            Clock.schedule_once(_register_symbol_fonts, 0)
+        
         # Load panel settings first
         self.panel_settings = get_panel_settings()
         settings_data = self.panel_settings.get_all()
@@ -809,20 +1102,15 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         # Apply settings to progbot module
         try:
             mode_text = settings_data.get('operation_mode', 'Program')
-            mode_mapping = {
-                "Identify Only": sequence.OperationMode.IDENTIFY_ONLY,
-                "Program": sequence.OperationMode.PROGRAM,
-                "Program & Test": sequence.OperationMode.PROGRAM_AND_TEST,
-                "Test Only": sequence.OperationMode.TEST_ONLY,
-            }
-            self.loaded_operation_mode = mode_mapping.get(mode_text, sequence.OperationMode.PROGRAM)
+            self.loaded_operation_mode = _MODE_MAPPING.get(mode_text, sequence.OperationMode.PROGRAM)
             log.info(f"[AsyncApp.build] Loaded settings from file")
         except Exception as e:
             log.error(f"[AsyncApp.build] Error loading settings: {e}")
         
-        # File chooser popup created on-demand in open_panel_file_chooser()
+        # File chooser and save dialog are created on-demand in
+        # open_panel_file_chooser() / open_save_panel_dialog()
         self.file_chooser_popup = None
-        self.save_panel_dialog = Factory.SavePanelDialog()
+        self.save_panel_dialog = None
         
         # Instantiate the AppRoot template via Factory
         root = Factory.AppRoot()
@@ -843,24 +1131,23 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         
         # Set panel file label to current file
         if self.panel_file_label and self.panel_settings:
-            import os as os_module
-            panel_name = os_module.path.basename(self.panel_settings.panel_file)
+            panel_name = os.path.basename(self.panel_settings.panel_file)
             self.panel_file_label.text = panel_name
         
         # Store references to config widgets for enable/disable
-        self.config_widgets = [
+        self.config_widgets = tuple(w for w in (
             root.ids.get('operation_spinner'),
             root.ids.get('network_firmware_input'),
             root.ids.get('main_firmware_input'),
             root.ids.get('config_tab_content')  # Add Config tab to disabled widgets
-        ]
+        ) if w is not None)
+        self._togglable_widgets = None
         
         # Disable all controls initially until ports are configured
         self._set_controls_enabled(False)
         
-        # Create and store the log popup
-        self.log_popup = Factory.LogPopup()
-        self.error_popup = Factory.ErrorPopup()
+        # Log and error popups are created on first open in
+        # toggle_log_popup() / _open_error_popup()
         
         # Create serial port chooser
         self.serial_port_selector = SerialPortSelector()
@@ -875,28 +1162,12 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         # Always load fresh panel-specific settings from panel_settings (the source of truth)
         settings_data = self.panel_settings.get_all() if self.panel_settings else {}
         
-        # Load hardware settings (port IDs) from main settings file
-        hardware_settings = get_settings().get_all()
+        # Load hardware settings (port IDs) from main settings file (read-only here)
+        hardware_settings = self._settings
         
         defaults = sequence.Config()
 
-        def _get(key, cast, fallback):
-            try:
-                value = settings_data.get(key, fallback)
-                # Handle boolean strings properly (bool('False') == True is wrong!)
-                if cast is bool and isinstance(value, str):
-                    return value.lower() in ('true', '1', 'yes')
-                return cast(value)
-            except Exception as e:
-                log.debug(f"[_config_from_settings] Cast failed for {key}: {e}")
-                return fallback
-
-        mode_mapping = {
-            "Identify Only": sequence.OperationMode.IDENTIFY_ONLY,
-            "Program": sequence.OperationMode.PROGRAM,
-            "Program & Test": sequence.OperationMode.PROGRAM_AND_TEST,
-            "Test Only": sequence.OperationMode.TEST_ONLY,
-        }
+        _get = partial(_cast_setting, settings_data)
 
         mode_text = settings_data.get('operation_mode', defaults.operation_mode.value)
         skip_positions = settings_data.get('skip_board_pos', []) or []
@@ -917,7 +1188,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             board_num_cols=_get('board_cols', int, defaults.board_num_cols),
             probe_plane_to_board=_get('probe_plane', float, defaults.probe_plane_to_board),
             contact_adjust_step=contact_adjust_step,
-            operation_mode=mode_mapping.get(mode_text, defaults.operation_mode),
+            operation_mode=_MODE_MAPPING.get(mode_text, defaults.operation_mode),
             skip_board_pos=skip_positions,
             motion_port_id=hardware_settings.get('motion_port_id', ''),
             motion_baud=defaults.motion_baud,
@@ -954,84 +1225,23 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         try:
             # Grid/origin/QR settings are now in the Panel Setup dialog and synced on open
             
-            # Load contact_adjust_step from main settings (not panel settings)
-            from settings import get_settings
-            main_settings = get_settings()
-            
-            contact_adjust_step_input = root.ids.get('contact_adjust_step_input')
-            if contact_adjust_step_input:
-                contact_adjust_step_input.text = str(float(main_settings.get('contact_adjust_step', 0.1)))
-            
-            # Load camera offsets and QR timeout from main settings (not panel settings)
-            from settings import get_settings
-            main_settings = get_settings()
-            
-            qr_scan_timeout_input = root.ids.get('qr_scan_timeout_input')
-            if qr_scan_timeout_input:
-                qr_scan_timeout_input.text = str(float(main_settings.get('qr_scan_timeout', 5.0)))
-            
-            qr_search_offset_input = root.ids.get('qr_search_offset_input')
-            if qr_search_offset_input:
-                qr_search_offset_input.text = str(float(main_settings.get('qr_search_offset', 2.0)))
-            
-            camera_offset_x_input = root.ids.get('camera_offset_x_input')
-            if camera_offset_x_input:
-                camera_offset_x_input.text = str(main_settings.get('camera_offset_x', 50.0))
-            
-            camera_offset_y_input = root.ids.get('camera_offset_y_input')
-            if camera_offset_y_input:
-                camera_offset_y_input.text = str(main_settings.get('camera_offset_y', 50.0))
-            
-            camera_rotation_spinner = root.ids.get('camera_rotation_spinner')
-            if camera_rotation_spinner:
-                rotation = main_settings.get('camera_preview_rotation', 0)
-                camera_rotation_spinner.text = f"{rotation}°"
-            
-            operation_spinner = root.ids.get('operation_spinner')
-            if operation_spinner:
-                operation_spinner.text = settings_data.get('operation_mode', 'Program')
-            
-            use_camera_checkbox = root.ids.get('use_camera_checkbox')
-            if use_camera_checkbox:
-                camera_setting = settings_data.get('use_camera', True)
-                use_camera_checkbox.active = camera_setting
-            
-            network_firmware_input = root.ids.get('network_firmware_input')
-            if network_firmware_input:
-                network_firmware_input.text = settings_data.get('network_core_firmware', '/home/steve/fw/merged_CPUNET.hex')
-            
-            main_firmware_input = root.ids.get('main_firmware_input')
-            if main_firmware_input:
-                main_firmware_input.text = settings_data.get('main_core_firmware', '/home/steve/fw/merged.hex')
+            sources = {'main': self._settings, 'panel': settings_data}
+            for widget_id, source, key, default, attr, fmt in _WIDGET_SETTINGS:
+                widget = root.ids.get(widget_id)
+                if widget:
+                    setattr(widget, attr, fmt(sources[source].get(key, default)))
             
             log.info(f"[AsyncApp] Applied settings to widgets")
         except Exception as e:
             log.error(f"[AsyncApp] Error applying settings to widgets: {e}")
 
-    def _set_config_widgets_enabled(self, enabled):
-        """Enable or disable all configuration widgets.
-        
-        Args:
-            enabled: True to enable, False to disable
-        """
-        if not hasattr(self, 'config_widgets'):
-            log.warning("[Config] Warning: config_widgets not initialized")
-            return
-        for widget in self.config_widgets:
-            if widget:
-                try:
-                    widget.disabled = not enabled
-                except Exception as e:
-                    log.error(f"[Config] Error setting widget disabled state: {e}")
-    
     def _set_controls_enabled(self, enabled):
         """Enable or disable all controls (config widgets, grid cells, and buttons).
         
         Args:
             enabled: True to enable, False to disable
         """
-        self._set_config_widgets_enabled(enabled)
-        self._set_grid_cells_enabled(enabled)
+        self._set_config_and_grid_enabled(enabled)
         
         # Also disable start/stop buttons if disabling
         if not enabled:
@@ -1041,38 +1251,51 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             self._set_widget('start_button', disabled=False)
             self._set_widget('stop_button', disabled=True)
 
-    def _set_grid_cells_enabled(self, enabled: bool):
-        """Enable or disable all grid cells."""
-        for cell in self.grid_cells.values():
-            try:
-                cell.disabled = not enabled
-            except Exception as e:
-                log.error(f"[Grid] Error setting cell enabled state: {e}")
-    
+    def _set_config_and_grid_enabled(self, enabled: bool):
+        """Enable or disable config widgets and grid cells in one pass."""
+        if self._togglable_widgets is None:
+            self._togglable_widgets = list(self.config_widgets)
+            self._togglable_widgets.extend(self.grid_cells.values())
+        disabled = not enabled
+        try:
+            for widget in self._togglable_widgets:
+                widget.disabled = disabled
+        except Exception as e:
+            log.error(f"[Config] Error setting widget disabled state: {e}")
+
     def update_grid_phase_states(self):
         """Update all grid cells with current phase enabled states from panel settings."""
         if not self.panel_settings:
             return
         
-        # Get phase enabled states from panel settings
-        vision_enabled = self.panel_settings.get('vision_enabled', True)
-        program_enabled = self.panel_settings.get('programming_enabled', True)
-        provision_enabled = self.panel_settings.get('provision_enabled', False)
-        test_enabled = self.panel_settings.get('test_enabled', False)
-        
-        # Probe follows vision
-        probe_enabled = vision_enabled
+        flags = self._cached_phase_flags
+        if flags is None:
+            # Get phase enabled states from panel settings
+            vision_enabled = self.panel_settings.get('vision_enabled', True)
+            program_enabled = self.panel_settings.get('programming_enabled', True)
+            provision_enabled = self.panel_settings.get('provision_enabled', False)
+            test_enabled = self.panel_settings.get('test_enabled', False)
+            
+            # Contact requires programming (same rule as cycle start)
+            flags = (vision_enabled, program_enabled, program_enabled,
+                     provision_enabled, test_enabled)
+            self._cached_phase_flags = flags
         
         # Update all grid cells
-        for cell in self.grid_cells.values():
-            try:
-                cell.vision_enabled = vision_enabled
-                cell.probe_enabled = probe_enabled
-                cell.program_enabled = program_enabled
-                cell.provision_enabled = provision_enabled
-                cell.test_enabled = test_enabled
-            except Exception as e:
-                log.error(f"[Grid] Error updating cell phase states: {e}")
+        try:
+            for cell in self.grid_cells.values():
+                cell.set_phase_flags(flags)
+        except Exception as e:
+            log.error(f"[Grid] Error updating cell phase states: {e}")
+
+    @staticmethod
+    def _phase_flags_from_config(config):
+        """Grid cell phase flags (see GridCell.set_phase_flags) for a Config."""
+        return (config.vision_enabled,
+                config.programming_enabled,  # Contact requires programming
+                config.programming_enabled,
+                config.provision_enabled,
+                config.test_enabled)
 
     def update_grid_from_settings(self):
         """Update grid display from current panel settings.
@@ -1080,6 +1303,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         Called after panel settings are saved to refresh the grid display
         with new phase enabled states and other settings.
         """
+        self._cached_phase_flags = None
         self.update_grid_phase_states()
 
     def home_machine(self, instance):
@@ -1121,8 +1345,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
                 self._set_widget('start_btn', disabled=False)
         
         # Run homing in async context
-        import asyncio
-        asyncio.ensure_future(do_homing())
+        asyncio.create_task(do_homing())
     
     # ==================== Panel Setup Dialog ====================
     # Thin wrapper methods that delegate to PanelSetupController
@@ -1392,146 +1615,53 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         """Access the config settings popup from the controller."""
         return self.config_settings_controller.popup if self.config_settings_controller else None
     
-    def cs_save_settings(self):
-        """Save settings from Config Settings dialog."""
-        if self.config_settings_controller:
-            self.config_settings_controller.save_settings()
-    
-    def cs_close(self):
-        """Close Config Settings dialog."""
-        if self.config_settings_controller:
-            self.config_settings_controller.close()
-    
-    def cs_camera_tab_changed(self, state):
-        """Handle Camera tab state changes."""
-        if self.config_settings_controller:
-            self.config_settings_controller.camera_tab_changed(state)
-    
-    def cs_on_camera_offset_x_change(self, text):
-        """Handle camera offset X change."""
-        if self.config_settings_controller:
-            self.config_settings_controller.on_camera_offset_x_change(text)
-    
-    def cs_on_camera_offset_y_change(self, text):
-        """Handle camera offset Y change."""
-        if self.config_settings_controller:
-            self.config_settings_controller.on_camera_offset_y_change(text)
-    
-    def cs_on_qr_scan_timeout_change(self, text):
-        """Handle QR scan timeout change."""
-        if self.config_settings_controller:
-            self.config_settings_controller.on_qr_scan_timeout_change(text)
-    
-    def cs_on_qr_search_offset_change(self, text):
-        """Handle QR search offset change."""
-        if self.config_settings_controller:
-            self.config_settings_controller.on_qr_search_offset_change(text)
-    
-    def cs_set_rotation(self, rotation):
-        """Set camera rotation."""
-        if self.config_settings_controller:
-            self.config_settings_controller.set_rotation(rotation)
-    
-    def cs_on_contact_adjust_step_change(self, text):
-        """Handle contact adjust step change."""
-        if self.config_settings_controller:
-            self.config_settings_controller.on_contact_adjust_step_change(text)
-    
-    def cs_reconfigure_motion_port(self):
-        """Open serial port selector for motion controller."""
-        if self.config_settings_controller:
-            self.config_settings_controller.reconfigure_motion_port()
-    
-    def cs_reconfigure_head_port(self):
-        """Open serial port selector for head controller."""
-        if self.config_settings_controller:
-            self.config_settings_controller.reconfigure_head_port()
-    
-    def cs_reconfigure_target_port(self):
-        """Open serial port selector for target device."""
-        if self.config_settings_controller:
-            self.config_settings_controller.reconfigure_target_port()
-    
-    def cs_jog_xy(self, axis, direction):
-        """Jog XY in the camera tab."""
-        if self.config_settings_controller:
-            self.config_settings_controller.jog_xy(axis, direction)
-    
-    def cs_set_jog_xy_step(self, step):
-        """Set XY jog step size."""
-        if self.config_settings_controller:
-            self.config_settings_controller.set_jog_xy_step(step)
-    
-    def cs_capture_camera_offset(self):
-        """Capture current position as camera offset."""
-        if self.config_settings_controller:
-            self.config_settings_controller.capture_camera_offset()
-    
-    def cs_reset_camera_offset(self):
-        """Reset camera offset to values from when tab was entered."""
-        if self.config_settings_controller:
-            self.config_settings_controller.reset_camera_offset()
+    # app.cs_<name>(...) calls config_settings_controller.<name>(...)
+    cs_save_settings = _forward_to_config_settings('save_settings', "Save settings from Config Settings dialog.")
+    cs_close = _forward_to_config_settings('close', "Close Config Settings dialog.")
+    cs_camera_tab_changed = _forward_to_config_settings('camera_tab_changed', "Handle Camera tab state changes.")
+    cs_on_camera_offset_x_change = _forward_to_config_settings('on_camera_offset_x_change', "Handle camera offset X change.")
+    cs_on_camera_offset_y_change = _forward_to_config_settings('on_camera_offset_y_change', "Handle camera offset Y change.")
+    cs_on_qr_scan_timeout_change = _forward_to_config_settings('on_qr_scan_timeout_change', "Handle QR scan timeout change.")
+    cs_on_qr_search_offset_change = _forward_to_config_settings('on_qr_search_offset_change', "Handle QR search offset change.")
+    cs_set_rotation = _forward_to_config_settings('set_rotation', "Set camera rotation.")
+    cs_on_contact_adjust_step_change = _forward_to_config_settings('on_contact_adjust_step_change', "Handle contact adjust step change.")
+    cs_reconfigure_motion_port = _forward_to_config_settings('reconfigure_motion_port', "Open serial port selector for motion controller.")
+    cs_reconfigure_head_port = _forward_to_config_settings('reconfigure_head_port', "Open serial port selector for head controller.")
+    cs_reconfigure_target_port = _forward_to_config_settings('reconfigure_target_port', "Open serial port selector for target device.")
+    cs_jog_xy = _forward_to_config_settings('jog_xy', "Jog XY in the camera tab.")
+    cs_set_jog_xy_step = _forward_to_config_settings('set_jog_xy_step', "Set XY jog step size.")
+    cs_capture_camera_offset = _forward_to_config_settings('capture_camera_offset', "Capture current position as camera offset.")
+    cs_reset_camera_offset = _forward_to_config_settings('reset_camera_offset', "Reset camera offset to values from when tab was entered.")
     
     # ==================== End Config Settings Dialog ====================
 
-    def _reset_cell_status(self, cell, is_skipped=False):
-        """Reset a single cell's status to initial state.
-        
-        Args:
-            cell: The GridCell to reset
-            is_skipped: Whether the cell is in the skip list
-        """
-        # Reset dot-based status fields
-        cell.vision_dot = DOT_DISABLED
-        cell.contact_dot = DOT_DISABLED
-        cell.program_dot = DOT_DISABLED
-        cell.provision_dot = DOT_DISABLED
-        cell.test_dot = DOT_DISABLED
-        cell.serial_number = ""
-        cell.failure_reason = ""
-        cell.result_icon = ""
-        cell.result_icon_color = [1, 1, 1, 1]
-        
-        # Stop any running animations
-        cell._stop_spinner()
-        cell._stop_pulse()
-        
-        # Set appearance based on skip state
-        if is_skipped:
-            cell.set_state_batch(False, [0, 0, 0, 1], cell.base_cell_label)
-        else:
-            cell.set_state_batch(True, [0.5, 0.5, 0.5, 1], cell.base_cell_label)
-    
     def reset_grid(self, instance):
         """Reset all grid cells to their default state as if panel was just loaded."""
         log.info(f"[ResetGrid] Button pressed")
         
         def do_reset(dt):
             # Get skip positions from current panel settings
-            skip_pos = get_settings().get('skip_board_pos', [])
+            skip_pos = self._settings.get('skip_board_pos', [])
+            skip_set = {tuple(pos) for pos in skip_pos}
+            coords = self._cell_coords
             
             # Reset all cells
             for cell_id, cell in self.grid_cells.items():
-                # Convert cell_id to [col, row]
-                col = cell_id // self.grid_rows
-                row_from_bottom = cell_id % self.grid_rows
-                is_skipped = [col, row_from_bottom] in skip_pos
-                
-                self._reset_cell_status(cell, is_skipped)
+                cell.reset_status(coords[cell_id] not in skip_set)
             
             # Reset phase label and stats display
             self._set_widget('phase_label', text="Ready")
             # Reset stats in popup if it exists
             self._last_stats_text = 'Ready'
-            if hasattr(self, 'stats_popup') and self.stats_popup:
+            if self.stats_popup:
                 stats_label = self.stats_popup.ids.get('stats_label')
                 if stats_label:
                     stats_label.text = 'Ready'
             
             # Clear board statuses and stats in bot
-            if self.bot:
-                self.bot.board_statuses = {}
-                self.bot.stats.reset()
+            if (bot := self.bot):
+                bot.board_statuses = {}
+                bot.stats.reset()
             
             log.info(f"[ResetGrid] Grid reset complete")
         
@@ -1543,15 +1673,16 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         log.info(f"[SkipAll] Button pressed")
         
         def do_skip(dt):
-            for cell_id, cell in self.grid_cells.items():
+            for cell in self.grid_cells.values():
                 # Keep board number label, just change checked state and color
-                cell.set_state_batch(False, [0, 0, 0, 1], cell.base_cell_label)
-            
-            # Save skip positions to settings and update bot
-            skip_pos = self.get_skip_board_pos()
-            get_settings().set('skip_board_pos', skip_pos)
-            if self.bot:
-                self.bot.set_skip_board_pos(skip_pos)
+                cell.set_state_batch(False, BG_OFF, cell.base_cell_label)
+            
+            # Save skip positions to settings and update bot (every cell is skipped)
+            self._save_skip_trigger.cancel()  # Saved right here instead
+            skip_pos = [list(pos) for pos in self._cell_coords.values()]
+            self._settings.set('skip_board_pos', skip_pos)
+            if (bot := self.bot):
+                bot.set_skip_board_pos(skip_pos)
             log.info(f"[SkipAll] All boards skipped")
         
         Clock.schedule_once(do_skip, 0)
@@ -1561,14 +1692,15 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         log.info(f"[EnableAll] Button pressed")
         
         def do_enable(dt):
-            for cell_id, cell in self.grid_cells.items():
-                cell.set_state_batch(True, [0.5, 0.5, 0.5, 1], cell.base_cell_label)
+            for cell in self.grid_cells.values():
+                cell.set_state_batch(True, BG_ON, cell.base_cell_label)
             
             # Save skip positions to settings and update bot (empty list = all enabled)
-            skip_pos = self.get_skip_board_pos()
-            get_settings().set('skip_board_pos', skip_pos)
-            if self.bot:
-                self.bot.set_skip_board_pos(skip_pos)
+            self._save_skip_trigger.cancel()  # Saved right here instead
+            skip_pos = []
+            self._settings.set('skip_board_pos', skip_pos)
+            if (bot := self.bot):
+                bot.set_skip_board_pos(skip_pos)
             log.info(f"[EnableAll] All boards enabled")
         
         Clock.schedule_once(do_enable, 0)
@@ -1581,8 +1713,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             self._set_widget('stop_button', disabled=True)
             self._set_widget('phase_label', text="Stopped")
             # Re-enable config widgets
-            self._set_config_widgets_enabled(True)
-            self._set_grid_cells_enabled(True)
+            self._set_config_and_grid_enabled(True)
             
             # Stop all cell animations (spinners and pulsing)
             for cell in self.grid_cells.values():
@@ -1595,13 +1726,12 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             log.error(f"[Stop] Error in widget updates: {e}")
         
         # Ensure camera preview is stopped and popup closed
-        if hasattr(self, 'bot') and self.bot and hasattr(self.bot, 'camera_preview'):
-            if self.bot.camera_preview:
-                try:
-                    self.bot.camera_preview.stop_preview()
-                    log.info("[Stop] Camera preview stopped")
-                except Exception as e:
-                    log.error(f"[Stop] Error stopping camera preview: {e}")
+        if self.bot and self.bot.camera_preview:
+            try:
+                self.bot.camera_preview.stop_preview()
+                log.info("[Stop] Camera preview stopped")
+            except Exception as e:
+                log.error(f"[Stop] Error stopping camera preview: {e}")
         
         # Switch back to idle view if camera was showing
         manager = self.root.ids.get('stats_camera_manager')
@@ -1609,7 +1739,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             manager.current = 'idle'
         
         # Cancel the running task
-        if (bot := getattr(self, 'bot_task', None)):
+        if (bot := self.bot_task):
             try:
                 log.info("[Stop] Cancelling bot task")
                 bot.cancel()
@@ -1627,7 +1757,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         log.info(f"[Start] Button pressed")
         
         # If there's a previous task still cleaning up, wait for it
-        if hasattr(self, 'bot_task') and self.bot_task and not self.bot_task.done():
+        if self.bot_task and not self.bot_task.done():
             log.info(f"[Start] Previous task still running, waiting for cleanup...")
             async def wait_and_start():
                 try:
@@ -1644,16 +1774,11 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
                 # Now actually start
                 await self._do_start()
             
-            loop = asyncio.get_event_loop()
-            loop.create_task(wait_and_start())
+            asyncio.create_task(wait_and_start())
             return
         
         # No previous task, start immediately
-        async def start_now():
-            await self._do_start()
-        
-        loop = asyncio.get_event_loop()
-        loop.create_task(start_now())
+        asyncio.create_task(self._do_start())
     
     async def _do_start(self):
         """Actually start the bot cycle."""
@@ -1661,35 +1786,26 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         self._set_widget('start_button', disabled=True)
         self._set_widget('stop_button', disabled=False)
         # Disable HOME and grid manipulation buttons during cycle
-        self._set_widget('home_btn', disabled=True)
-        self._set_widget('reset_grid_btn', disabled=True)
-        self._set_widget('skip_all_btn', disabled=True)
-        self._set_widget('enable_all_btn', disabled=True)
-        self._set_widget('calibrate_btn', disabled=True)
+        for name in ('home_btn', 'reset_grid_btn', 'skip_all_btn', 'enable_all_btn', 'calibrate_btn'):
+            self._set_widget(name, disabled=True)
         # Disable config widgets during operation
-        self._set_config_widgets_enabled(False)
-        self._set_grid_cells_enabled(False)
+        self._set_config_and_grid_enabled(False)
         
         # Get skip positions
         skip_pos = self.get_skip_board_pos()
         
-        # Reset active cells (not skipped) to initial state before starting
-        for cell_id, cell in self.grid_cells.items():
-            # Convert cell_id to [col, row]
-            col = cell_id // self.grid_rows
-            row_from_bottom = cell_id % self.grid_rows
-            is_skipped = [col, row_from_bottom] in skip_pos
-            
-            # Reset cell status (skipped cells stay black)
-            self._reset_cell_status(cell, is_skipped)
+        # Reset cells to initial state before starting; the skip list was just
+        # read from the cells, so each keeps its own checked state (skipped stay black)
+        for cell in self.grid_cells.values():
+            cell.reset_status(cell.cell_checked)
         
         # Clear board statuses in bot before starting
-        if self.bot:
-            self.bot.board_statuses = {}
-            self.bot.stats.reset()
+        if (bot := self.bot):
+            bot.board_statuses = {}
+            bot.stats.reset()
         
         # Update skip board positions from unchecked cells
-        if (b := getattr(self, 'bot', None)):
+        if (b := self.bot):
             # Reload the entire config from current settings
             new_config = self._config_from_settings()
             self._debug_phase_flags(new_config)  # Log phase flags for debugging
@@ -1697,25 +1813,17 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             b.set_skip_board_pos(skip_pos)
             
             # Update grid cells with phase enabled flags
+            flags = self._phase_flags_from_config(new_config)
             for cell in self.grid_cells.values():
-                cell.vision_enabled = new_config.vision_enabled
-                cell.contact_enabled = new_config.programming_enabled  # Contact requires programming
-                cell.program_enabled = new_config.programming_enabled
-                cell.provision_enabled = new_config.provision_enabled
-                cell.test_enabled = new_config.test_enabled
+                cell.set_phase_flags(flags)
         else:
             log.warning(f"[Start] Warning: Bot not found")
         
-        if (b := getattr(self, 'bot', None)):
+        if (b := self.bot):
             log.info(f"[Start] Creating bot task")
             
             # Reconnect stats_updated signal (in case it was disconnected after previous cycle)
-            try:
-                # First disconnect any existing connection to avoid duplicates
-                b.stats_updated.disconnect(listener=self.on_stats_updated)
-            except:
-                pass  # Ignore if not connected
-            b.stats_updated.connect(self.on_stats_updated)
+            self._connect_stats_updated()
             log.info(f"[Start] Reconnected stats_updated signal")
             
             self.bot_task = asyncio.create_task(b.full_cycle())
@@ -1740,15 +1848,14 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             return
         
         # Check if a cycle is already running
-        if hasattr(self, 'bot_task') and self.bot_task and not self.bot_task.done():
+        if self.bot_task and not self.bot_task.done():
             log.warning("[SingleBoard] Cannot run - cycle already in progress")
             return
         
         # Disable UI during single-board run
         self._set_widget('start_button', disabled=True)
         self._set_widget('stop_button', disabled=False)
-        self._set_config_widgets_enabled(False)
-        self._set_grid_cells_enabled(False)
+        self._set_config_and_grid_enabled(False)
         
         try:
             # Reload config from current settings
@@ -1758,19 +1865,10 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             # Update grid cell with phase enabled flags
             cell_id = position[0] * self.grid_rows + position[1]
             if cell_id in self.grid_cells:
-                cell = self.grid_cells[cell_id]
-                cell.vision_enabled = new_config.vision_enabled
-                cell.contact_enabled = new_config.programming_enabled
-                cell.program_enabled = new_config.programming_enabled
-                cell.provision_enabled = new_config.provision_enabled
-                cell.test_enabled = new_config.test_enabled
+                self.grid_cells[cell_id].set_phase_flags(self._phase_flags_from_config(new_config))
             
             # Reconnect stats signal
-            try:
-                self.bot.stats_updated.disconnect(listener=self.on_stats_updated)
-            except:
-                pass
-            self.bot.stats_updated.connect(self.on_stats_updated)
+            self._connect_stats_updated()
             
             # Run cycle for single board
             await self.bot.process_single_board(position)
@@ -1783,20 +1881,34 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             # Re-enable UI
             self._set_widget('start_button', disabled=False)
             self._set_widget('stop_button', disabled=True)
-            self._set_config_widgets_enabled(True)
-            self._set_grid_cells_enabled(True)
+            self._set_config_and_grid_enabled(True)
             
             # Disconnect stats signal
-            try:
-                self.bot.stats_updated.disconnect(listener=self.on_stats_updated)
-            except:
-                pass
+            self._disconnect_stats_updated()
             
             log.info(f"[SingleBoard] Completed for position {position}")
 
+    def _connect_stats_updated(self):
+        """Connect bot.stats_updated to on_stats_updated unless already connected."""
+        if self._stats_connected_bot is not self.bot:
+            self._disconnect_stats_updated()
+            self.bot.stats_updated.connect(self.on_stats_updated)
+            self._stats_connected_bot = self.bot
+
+    def _disconnect_stats_updated(self):
+        """Disconnect on_stats_updated if connected.
+        
+        Returns:
+            True if a connection was removed
+        """
+        if (bot := self._stats_connected_bot) is None:
+            return False
+        self._stats_connected_bot = None
+        bot.stats_updated.disconnect(listener=self.on_stats_updated)
+        return True
+
     def _on_task_complete(self, task):
         """Called when the bot task completes or is cancelled."""
-        from datetime import datetime
         
         # Dump diagnostics to see system state
         dump_diagnostics("TASK_COMPLETE")
@@ -1812,38 +1924,31 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         # Disconnect frequent signal emitters to prevent orphaned tasks
         # These signals fire during cycles and can cause issues if emitted after completion
         # Note: We don't disconnect all signals since some are needed for UI updates
-        if hasattr(self, 'bot') and self.bot:
-            try:
-                # Disconnect stats_updated since it's emitted frequently and can pile up
-                if hasattr(self.bot, 'stats_updated'):
-                    self.bot.stats_updated.disconnect(listener=self.on_stats_updated)
-                    log.info("[Task Complete] Disconnected stats_updated signal")
-            except Exception as e:
-                log.error(f"[Task Complete] Error disconnecting signals: {e}")
+        # Disconnect stats_updated since it's emitted frequently and can pile up
+        if self._disconnect_stats_updated():
+            log.info("[Task Complete] Disconnected stats_updated signal")
 
-        # Re-enable start button and config widgets
-        Clock.schedule_once(lambda dt: self._set_widget('start_button', disabled=False))
-        Clock.schedule_once(lambda dt: self._set_widget('stop_button', disabled=True))
-        # Stop the cycle timer
-        Clock.schedule_once(lambda dt: self._stop_cycle_timer())
-        # Re-enable HOME and grid manipulation buttons
-        Clock.schedule_once(lambda dt: self._set_widget('home_btn', disabled=False))
-        Clock.schedule_once(lambda dt: self._set_widget('reset_grid_btn', disabled=False))
-        Clock.schedule_once(lambda dt: self._set_widget('skip_all_btn', disabled=False))
-        Clock.schedule_once(lambda dt: self._set_widget('enable_all_btn', disabled=False))
-        Clock.schedule_once(lambda dt: self._set_widget('calibrate_btn', disabled=False))
-        Clock.schedule_once(lambda dt: self._set_config_widgets_enabled(True))
-        Clock.schedule_once(lambda dt: self._set_grid_cells_enabled(True))
+        # Restore the idle UI state on the next frame
+        Clock.schedule_once(self._reenable_ui_after_task)
         
         # Show cycle summary popup (only if cycle completed, not cancelled)
-        if not was_cancelled and hasattr(self, 'bot') and self.bot and self.bot.board_statuses:
+        if not was_cancelled and self.bot and self.bot.board_statuses:
             Clock.schedule_once(lambda dt: self._show_cycle_summary())
         
         self.bot_task = None
     
+    def _reenable_ui_after_task(self, dt=None):
+        """Stop the cycle timer and re-enable controls after the bot task ends."""
+        self._set_widget('start_button', disabled=False)
+        self._set_widget('stop_button', disabled=True)
+        self._stop_cycle_timer()
+        # Re-enable HOME and grid manipulation buttons
+        for name in ('home_btn', 'reset_grid_btn', 'skip_all_btn', 'enable_all_btn', 'calibrate_btn'):
+            self._set_widget(name, disabled=False)
+        self._set_config_and_grid_enabled(True)
+
     def _show_cycle_summary(self):
         """Show the cycle summary popup after a cycle completes."""
-        from datetime import datetime
         
         try:
             # Build the summary from bot data
@@ -1870,7 +1975,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
                 start_time=start_time,
                 end_time=end_time,
                 board_times=stats.board_times,
-                grid_rows=self.grid_rows if hasattr(self, 'grid_rows') else 1,
+                grid_rows=self.grid_rows or 1,
                 skipped_positions=skip_positions,
             )
             
@@ -1901,8 +2006,6 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
     
     def _on_export_summary(self, summary, format_type):
         """Handle export request from summary popup."""
-        import os
-        from datetime import datetime
         
         try:
             # Export to exports directory
@@ -1911,10 +2014,8 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             
             handler = FileExportHandler(export_dir, format=format_type)
             
-            # Run async handler synchronously
-            import asyncio
-            loop = asyncio.get_event_loop()
-            loop.create_task(handler.on_cycle_complete(summary))
+            # Run the async handler in the background
+            asyncio.create_task(handler.on_cycle_complete(summary))
             
             log.info(f"[CycleSummary] Exported {format_type} to {export_dir}")
             
@@ -1929,12 +2030,27 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             cell_id: The cell ID (0-indexed from bottom-left)
             board_status: BoardStatus object with status information
         """
-        if cell := self.grid_cells.get(cell_id):
-            Clock.schedule_once(lambda dt: cell.update_status(board_status))
+        color = self._pending_cell_updates.get(cell_id, (None, None))[1]
+        self._pending_cell_updates[cell_id] = (board_status, color)
+        self._cell_update_trigger()
+
+    def _flush_cell_updates(self, dt=None):
+        """Apply the latest pending status and color to each changed cell.
+        
+        An explicit color from on_cell_color_change is applied after the
+        status, so it wins over the status-derived background.
+        """
+        pending, self._pending_cell_updates = self._pending_cell_updates, {}
+        for cell_id, (board_status, color) in pending.items():
+            if cell := self.grid_cells.get(cell_id):
+                if board_status is not None:
+                    cell.update_status(board_status)
+                if color is not None:
+                    cell.cell_bg_color = color
 
     @listener
     async def on_phase_change(self, value):
-        if (lbl := getattr(self, 'phase_label', None)):
+        if (lbl := self.phase_label):
             Clock.schedule_once(lambda dt: setattr(lbl, 'text', str(value)))
 
     @listener
@@ -1949,8 +2065,9 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             cell_id: The cell ID (0-indexed from bottom-left)
             color_rgba: List or tuple [r, g, b, a] with values 0-1
         """
-        if cell := self.grid_cells.get(cell_id):
-            Clock.schedule_once(lambda dt: setattr(cell, 'cell_bg_color', color_rgba))
+        board_status = self._pending_cell_updates.get(cell_id, (None, None))[0]
+        self._pending_cell_updates[cell_id] = (board_status, list(color_rgba))
+        self._cell_update_trigger()
 
     @listener
     async def on_error_occurred(self, error_info):
@@ -1960,15 +2077,16 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
     @listener
     async def on_stats_updated(self, stats_text):
         """Update the cycle statistics display."""
-        def do_update(dt):
-            # Update stats in the popup if it exists
-            if hasattr(self, 'stats_popup') and self.stats_popup:
-                stats_label = self.stats_popup.ids.get('stats_label')
-                if stats_label:
-                    stats_label.text = stats_text
-            # Also store the latest stats text for when popup is opened
-            self._last_stats_text = stats_text
-        Clock.schedule_once(do_update)
+        # Store the latest stats text (also used when the popup is opened)
+        self._last_stats_text = stats_text
+        self._stats_flush_trigger()
+    
+    def _flush_stats(self, dt=None):
+        """Write the latest stats text to the popup label, if it exists."""
+        if self.stats_popup:
+            stats_label = self.stats_popup.ids.get('stats_label')
+            if stats_label:
+                stats_label.text = self._last_stats_text
     
     @listener
     async def on_qr_scan_started(self):
@@ -1994,8 +2112,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             self.bot_task.cancel()
         self._set_widget('start_button', disabled=False)
         self._set_widget('stop_button', disabled=True)
-        self._set_config_widgets_enabled(True)
-        self._set_grid_cells_enabled(True)
+        self._set_config_and_grid_enabled(True)
 
     def on_error_retry(self):
         if self.error_popup:
@@ -2012,19 +2129,17 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             return
 
         # Prep cell visual state for retry
-        cell_id = col * self.grid_rows + row if hasattr(self, 'grid_rows') else None
+        cell_id = col * self.grid_rows + row if self.grid_rows is not None else None
         if cell_id is not None and (cell := self.grid_cells.get(cell_id)):
             cell.cell_bg_color = [0.3, 0.3, 0.3, 1]
-            cell.status_line1 = ""
-            cell.status_line2 = ""
+            cell.clear_status_text()
+            cell.clear_status_cache()
 
-        loop = asyncio.get_event_loop()
         self._set_widget('start_button', disabled=True)
         self._set_widget('stop_button', disabled=False)
-        self._set_config_widgets_enabled(False)
-        self._set_grid_cells_enabled(False)
+        self._set_config_and_grid_enabled(False)
         log.info(f"[ErrorPopup] Retrying board [{col}, {row}]")
-        self.bot_task = loop.create_task(self.bot.retry_board(col, row))
+        self.bot_task = asyncio.create_task(self.bot.retry_board(col, row))
         self.bot_task.add_done_callback(self._on_task_complete)
 
     def on_error_skip(self):
@@ -2036,7 +2151,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
         row = info.get('row') if isinstance(info, dict) else None
         if col is None or row is None:
             return
-        if not hasattr(self, 'grid_rows') or not hasattr(self, 'grid_cols'):
+        if self.grid_rows is None or self.grid_cols is None:
             log.warning("[ErrorPopup] Grid dimensions not initialized; cannot skip")
             return
 
@@ -2045,7 +2160,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             if (cell := self.grid_cells.get(cell_id)):
                 cell.cell_checked = False
             skip_positions = self.get_skip_board_pos()
-            get_settings().set('skip_board_pos', skip_positions)
+            self._settings.set('skip_board_pos', skip_positions)
             if self.bot:
                 self.bot.set_skip_board_pos(skip_positions)
             log.info(f"[ErrorPopup] Skipped board [{col}, {row}]")
@@ -2098,13 +2213,13 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             target_label = root.ids.get('target_port_label')
             
             if self.bot:
-                if hasattr(self.bot, 'motion') and self.bot.motion and hasattr(self.bot.motion, 'port'):
+                if self.bot.motion:
                     if motion_label:
                         motion_label.text = self.bot.motion.port or "Not configured"
-                if hasattr(self.bot, 'head') and self.bot.head and hasattr(self.bot.head, 'port'):
+                if self.bot.head:
                     if head_label:
                         head_label.text = self.bot.head.port or "Not configured"
-                if hasattr(self.bot, 'target') and self.bot.target and hasattr(self.bot.target, 'port'):
+                if self.bot.target:
                     if target_label:
                         target_label.text = self.bot.target.port or "Not configured"
         except Exception as e:
@@ -2118,35 +2233,17 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
                 return
             
             # Clear the selected port ID so it will prompt for selection
-            from settings import get_settings
-            settings = get_settings()
-            
-            port = None
-            if device_type == "Motion Controller":
-                settings.set('motion_port_id', '')
-                port = await self.bot._resolve_port_async('', "Motion Controller", None, is_reconfigure=True)
-                # Reinitialize motion controller with new port
-                from motion_controller import MotionController
-                self.bot.motion = MotionController(self.bot.update_phase, port, self.bot.config.motion_baud)
-                # Connect and initialize the new controller
-                await self.bot.motion.connect()
-                await self.bot.motion.init()
-            elif device_type == "Head Controller":
-                settings.set('head_port_id', '')
-                port = await self.bot._resolve_port_async('', "Head Controller", None, is_reconfigure=True)
-                # Reinitialize head controller with new port
-                from head_controller import HeadController
-                self.bot.head = HeadController(self.bot.update_phase, port, self.bot.config.head_baud)
-                # Connect the new controller
-                await self.bot.head.connect()
-            elif device_type == "Target Device":
-                settings.set('target_port_id', '')
-                port = await self.bot._resolve_port_async('', "Target Device", None, is_reconfigure=True)
-                # Reinitialize target controller with new port
-                from target_controller import TargetController
-                self.bot.target = TargetController(self.bot.update_phase, port, self.bot.config.target_baud)
-                # Connect and initialize the new controller
-                await self.bot.target.connect()
+            settings = self._settings
+            
+            controller_cls, bot_attr, port_key, baud_attr, needs_init = _PORT_CONFIG[device_type]
+            settings.set(port_key, '')
+            port = await self.bot._resolve_port_async('', device_type, None, is_reconfigure=True)
+            # Reinitialize the controller with the new port, then connect it
+            controller = controller_cls(self.bot.update_phase, port, getattr(self.bot.config, baud_attr))
+            setattr(self.bot, bot_attr, controller)
+            await controller.connect()
+            if needs_init:
+                await controller.init()
             
             # Update the labels after reconfiguration
             self.update_port_labels()
@@ -2172,7 +2269,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
     def app_func(self):
         async def run_wrapper():
             # Ensure panel_settings is loaded (build() may not have run yet)
-            if not hasattr(self, 'panel_settings') or self.panel_settings is None:
+            if self.panel_settings is None:
                 self.panel_settings = get_panel_settings()
             
             config = self._config_from_settings()
@@ -2188,7 +2285,7 @@ class AsyncApp(SettingsHandlersMixin, PanelFileManagerMixin, ProvisionStepEditor
             self.bot.cell_color_changed.connect(self.on_cell_color_change)
             self.bot.board_status_changed.connect(self.on_board_status_change)
             self.bot.error_occurred.connect(self.on_error_occurred)
-            self.bot.stats_updated.connect(self.on_stats_updated)
+            self._connect_stats_updated()
             self.bot.qr_scan_started.connect(self.on_qr_scan_started)
             self.bot.qr_scan_ended.connect(self.on_qr_scan_ended)
             
@@ -13,11 +13,24 @@ Usage in any module:
 
 Log output goes to /tmp/progbot.log with format:
     [HH:MM:SS.mmm] [LEVEL] [module] message
+
+Set PROGBOT_LOG_LEVEL (e.g. INFO) to raise the root level; DEBUG calls that
+use lazy %-style arguments then cost only a level check.
+
+Records are handed to a background thread through a queue, so logging from
+the event loop (e.g. the serial paths) never blocks on file or console I/O.
+The log file is flushed in batches rather than after every record, and
+once the queue has been idle for FLUSH_INTERVAL; warnings and errors are
+flushed immediately.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import time
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 # Log file path - same location we were using before
 LOG_FILE_PATH = '/tmp/progbot.log'
@@ -25,24 +38,107 @@ LOG_FILE_PATH = '/tmp/progbot.log'
 # Flag to track if logging has been configured
 _logging_configured = False
 
+# Background thread that writes queued records to the real handlers
+_queue_listener = None
+
+# Minimum time between flushes of the log file for DEBUG/INFO records
+FLUSH_INTERVAL = 0.2
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the HH:MM:SS string for records in the same second.
+
+    Formatter.formatTime() calls localtime() and strftime() for every record;
+    bursts of log lines mostly share the same second, so cache that prefix.
+    Milliseconds are still added per record by the %(msecs)03d field.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = None
+        self._cached_time = ''
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+
+class _BatchedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that coalesces flushes.
+
+    StreamHandler flushes after every record, which costs a write syscall per
+    log line during chatty phases (jogging, serial traffic). Here the buffer is
+    only flushed once FLUSH_INTERVAL has elapsed, or immediately for WARNING
+    and above so problems are never stuck in the buffer.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._last_flush = 0.0
+        super().__init__(*args, **kwargs)
+
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            self.flush_now()
+
+    def flush(self):
+        now = time.monotonic()
+        if now - self._last_flush >= FLUSH_INTERVAL:
+            self.flush_now(now)
+
+    def flush_now(self, now=None):
+        """Flush the underlying stream regardless of the interval."""
+        super().flush()
+        self._last_flush = time.monotonic() if now is None else now
+
+    def close(self):
+        self.acquire()
+        try:
+            self.flush_now()
+        finally:
+            self.release()
+        super().close()
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes batched handlers once the queue has been idle.
+
+    _BatchedRotatingFileHandler only flushes when a new record arrives after
+    FLUSH_INTERVAL, so the last records before a quiet period would sit in the
+    buffer. If no record arrives for FLUSH_INTERVAL, flush them then; records
+    arriving closer together keep being batched.
+    """
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get(block, timeout=FLUSH_INTERVAL)
+        except queue.Empty:
+            for handler in self.handlers:
+                if isinstance(handler, _BatchedRotatingFileHandler):
+                    handler.flush_now()
+            return self.queue.get(block)
+
 
 def setup_logging(level=logging.DEBUG):
     """Configure the root logger with file and optional console handlers.
     
     Call this once at application startup (in kvui.py).
     """
-    global _logging_configured
+    global _logging_configured, _queue_listener
     if _logging_configured:
         return
     
     # Create formatter with timestamp, level, module name
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         '[%(asctime)s.%(msecs)03d] [%(levelname)s] [%(name)s] %(message)s',
         datefmt='%H:%M:%S'
     )
     
     # File handler with rotation (5MB max, keep 3 backups)
-    file_handler = RotatingFileHandler(
+    file_handler = _BatchedRotatingFileHandler(
         LOG_FILE_PATH,
         maxBytes=5*1024*1024,  # 5MB
         backupCount=3,
@@ -56,11 +152,23 @@ def setup_logging(level=logging.DEBUG):
     console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.INFO)  # Console only gets INFO+
     
-    # Configure root logger
+    # Loggers only enqueue records; the listener thread formats and writes them
+    log_queue = queue.SimpleQueue()
+    _queue_listener = _FlushingQueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+    
+    # Configure root logger (PROGBOT_LOG_LEVEL overrides the default level)
+    env_level = os.environ.get('PROGBOT_LOG_LEVEL')
+    if env_level:
+        level = logging.getLevelName(env_level.upper())
+        if not isinstance(level, int):
+            level = logging.DEBUG
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
     
     # Suppress noisy third-party loggers
     logging.getLogger('kivy').setLevel(logging.WARNING)
@@ -26,15 +26,9 @@ class MotionController:
     async def connect(self):
         """Connect to motion controller if not already connected."""
         # Check if existing connection is still alive
-        if self.device is not None:
-            try:
-                # Quick health check - see if reader/writer still exist
-                if self.device.reader is None or self.device.writer is None or self.device.writer.is_closing():
-                    log.debug(f"[MotionController] Connection dead, reconnecting to {self.port}")
-                    self.device = None
-            except Exception as e:
-                log.debug(f"[MotionController] Health check failed: {e}, reconnecting")
-                self.device = None
+        if self.device is not None and not self.device.is_alive():
+            log.debug(f"[MotionController] Connection dead, reconnecting to {self.port}")
+            self.device = None
         
         if self.device is None:
             log.debug(f"[MotionController] Connecting to {self.port}")
@@ -124,15 +118,20 @@ class MotionController:
         """Query current machine position. Returns dict with 'x', 'y', 'z' keys."""
         await self.connect()
         
+        # Discard leftover lines (late replies, old status reports) so the
+        # first status line read below answers this query
+        if stale := self.device.drain_lines():
+            log.debug(f"[MOTION] Cleared {len(stale)} stale line(s) before position query: {stale}")
+        
         # Send status query
         self.device.writer.write("?\n".encode())
         await self.device.writer.drain()
         
         # Read responses until we get status or timeout
-        start_time = time.time()
-        while time.time() - start_time < 2.0:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < 2.0:
             try:
-                response = await asyncio.wait_for(self.device.line_queue.get(), timeout=0.5)
+                response = await self.device.read_line(timeout=0.5)
                 log.debug(f"[MOTION] Position query response: {response}")
                 if '<' in response and '>' in response:
                     # Parse status: <Idle|MPos:0.000,0.000,0.000|WPos:0.000,0.000,0.000>
@@ -173,18 +172,22 @@ class MotionController:
         """Execute probe operation and return measured distance."""
         await self.connect()
         
+        # Discard leftover lines so an old 'Z:' can't be taken as this result
+        if stale := self.device.drain_lines():
+            log.debug(f"[MOTION] Cleared {len(stale)} stale line(s) before probe: {stale}")
+        
         # Send probe command directly to writer
         self.device.writer.write("M280 G4 P0.5 G30 M281 G4 P0.5 M400\n".encode())
         await self.device.writer.drain()
         log.debug("[MOTION] Probe command sent, waiting for Z: response...")
         
         # Keep reading responses until we get one with 'Z:' or timeout
-        start_time = time.time()
+        start_time = time.monotonic()
         timeout = 15.0
         
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             try:
-                response = await asyncio.wait_for(self.device.line_queue.get(), timeout=1.0)
+                response = await self.device.read_line(timeout=1.0)
                 log.debug(f"[MOTION] Probe response: {response}")
                 log.info(f"Received: {response}")
                 
@@ -25,6 +25,7 @@ class PanelFileManagerMixin:
     - self.panel_settings: PanelSettings instance
     - self.panel_file_label: Label showing current panel filename
     - self.settings_data: Dict of current settings
+    - self._cached_phase_flags: Grid phase flags, cleared when a panel is loaded
     - self.root: The Kivy root widget
     - self._apply_settings_to_widgets_now(): Method to refresh widgets
     - self._reload_bot_config(): Method to reload bot configuration
@@ -221,6 +222,7 @@ class PanelFileManagerMixin:
         try:
             self.panel_settings.load_file(path)
             self.settings_data = self.panel_settings.get_all()
+            self._cached_phase_flags = None
             # Update the panel file label
             panel_name = os.path.basename(path)
             if self.panel_file_label:
@@ -321,8 +321,7 @@ class ProvisioningEngine:
                 break
             
             try:
-                line = await asyncio.wait_for(
-                    device.line_queue.get(),
+                line = await device.read_line(
                     timeout=min(remaining, 0.5)  # Check pattern every 0.5s
                 )
                 
@@ -377,13 +376,7 @@ class ProvisioningEngine:
         Returns:
             Number of lines drained
         """
-        count = 0
-        while not device.line_queue.empty():
-            try:
-                device.line_queue.get_nowait()
-                count += 1
-            except asyncio.QueueEmpty:
-                break
+        count = len(device.drain_lines())
         
         if count > 0:
             logger.debug(f"Drained {count} pending lines from queue")
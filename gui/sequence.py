@@ -270,6 +270,9 @@ class ProgBot:
         self.stats = CycleStats()  # Timing statistics
         self.panel_settings = panel_settings  # Store reference for later use
         self.gui_port_picker = gui_port_picker  # Function to show GUI port picker
+        self.camera_preview = None  # CameraPreview, attached by the GUI when the camera is used
+        self._skip_source = None  # skip_board_pos list that _skip_set was built from
+        self._skip_set = frozenset()
         self._cycle_active = False  # Flag to prevent signal emissions after cycle ends
         
         # Initialize programmer from plugin system
@@ -441,7 +444,7 @@ class ProgBot:
         if position not in self.board_statuses:
             board_status = BoardStatus(position)
             # Set enabled=False if position is in skip list
-            if [col, row] in self.config.skip_board_pos:
+            if self._is_skipped(col, row):
                 board_status.enabled = False
             self.board_statuses[position] = board_status
         return self.board_statuses[position]
@@ -456,9 +459,21 @@ class ProgBot:
         log.debug(f"Updated skip_board_pos: {self.config.skip_board_pos}")
         
         # Update enabled field for all existing board statuses
-        for position, board_status in self.board_statuses.items():
-            col, row = position
-            board_status.enabled = [col, row] not in skip_positions
+        for (col, row), board_status in self.board_statuses.items():
+            board_status.enabled = not self._is_skipped(col, row)
+    
+    def _is_skipped(self, col, row):
+        """Check whether [col, row] is in config.skip_board_pos.
+        
+        The skip list stays a list of [col, row] lists (that's what settings
+        store), but lookups go through a set rebuilt only when a different
+        list is assigned to the config.
+        """
+        skip_positions = self.config.skip_board_pos
+        if skip_positions is not self._skip_source:
+            self._skip_source = skip_positions
+            self._skip_set = frozenset(map(tuple, skip_positions))
+        return (col, row) in self._skip_set
     
     def init_panel(self):
         """Call this after listeners are connected to emit panel dimensions."""
@@ -871,7 +886,7 @@ class ProgBot:
         board_status = self.get_board_status(col, row)
         cell_id = col * self.config.board_num_rows + row
 
-        if [col, row] in self.config.skip_board_pos:
+        if self._is_skipped(col, row):
             log.info(f"SKIPPING col={col} row={row}")
             self._mark_probe(cell_id, board_status, ProbeStatus.SKIPPED)
             self._mark_program(cell_id, board_status, ProgramStatus.SKIPPED)
@@ -1125,7 +1140,7 @@ class ProgBot:
         self.qr_scan_started.emit()
         
         # Start preview once at the beginning (camera running at 4 FPS to reduce GIL contention)
-        if hasattr(self, 'camera_preview') and self.camera_preview:
+        if self.camera_preview:
             from kivy.clock import Clock
             Clock.schedule_once(lambda dt: self.camera_preview.start_preview(), 0)
             await asyncio.sleep(0.15)
@@ -1139,7 +1154,7 @@ class ProgBot:
                     log.debug(f"[_scan_all_boards_for_qr] Processing board [{col},{row}]")
                     
                     # Skip if already marked to skip
-                    if [col, row] in self.config.skip_board_pos:
+                    if self._is_skipped(col, row):
                         log.debug(f"[_scan_all_boards_for_qr] Board [{col},{row}] is in skip list, skipping")
                         self.stats.record_skip()
                         continue
@@ -1181,7 +1196,7 @@ class ProgBot:
                         # QR scanning (fast-path will try immediate detection first)
                         qr_data = None
                         if self.vision:
-                            preview = self.camera_preview if hasattr(self, 'camera_preview') else None
+                            preview = self.camera_preview
                             
                             qr_data = await self.vision.scan_qr_code(
                                 retries=2, 
@@ -1246,7 +1261,7 @@ class ProgBot:
         
         except asyncio.CancelledError:
             # Stop camera preview if it's still active
-            if hasattr(self, 'camera_preview') and self.camera_preview:
+            if self.camera_preview:
                 self.camera_preview.stop_preview()
             log.debug("[_scan_all_boards_for_qr] Cancelled during QR scan")
             log.info("[ProgBot] QR scan cancelled")
@@ -1254,14 +1269,14 @@ class ProgBot:
             raise
         finally:
             # Ensure preview is stopped even on normal completion
-            if hasattr(self, 'camera_preview') and self.camera_preview:
+            if self.camera_preview:
                 self.camera_preview.stop_preview()
         
         # Move to safe height after scanning
         await self.motion.rapid_z_abs(0.0)
         
         # Stop preview once at the end
-        if hasattr(self, 'camera_preview') and self.camera_preview:
+        if self.camera_preview:
             from kivy.clock import Clock
             Clock.schedule_once(lambda dt: self.camera_preview.stop_preview(), 0)
             await asyncio.sleep(0.1)
@@ -1328,7 +1343,7 @@ class ProgBot:
                 log.debug("[full_cycle] Camera disconnected")
             
             # Then cleanup camera preview
-            if hasattr(self, 'camera_preview') and self.camera_preview:
+            if self.camera_preview:
                 log.debug("[full_cycle] Stopping camera preview...")
                 from kivy.clock import Clock
                 Clock.schedule_once(lambda dt: self.camera_preview.stop_preview(), 0)
@@ -1428,7 +1443,7 @@ class ProgBot:
             # Connections stay open for application lifetime
             
             # Stop camera preview (but keep camera subprocess running)
-            if hasattr(self, 'camera_preview') and self.camera_preview:
+            if self.camera_preview:
                 log.debug("[full_cycle] Stopping camera preview...")
                 from kivy.clock import Clock
                 Clock.schedule_once(lambda dt: self.camera_preview.stop_preview(), 0)
@@ -1457,7 +1472,7 @@ class ProgBot:
                 await self.vision.disconnect()
             
             # Then cleanup camera preview
-            if hasattr(self, 'camera_preview') and self.camera_preview:
+            if self.camera_preview:
                 from kivy.clock import Clock
                 Clock.schedule_once(lambda dt: self.camera_preview.stop_preview(), 0)
             
@@ -45,8 +45,8 @@ pip install kivy[base]
 echo "  - pynnex (event system)"
 pip install pynnex
 
-echo "  - pyserial-asyncio (async serial communication)"
-pip install pyserial-asyncio
+echo "  - pyserial (serial communication)"
+pip install pyserial
 
 echo "  - opencv-python (computer vision and QR code scanning)"
 pip install opencv-python
@@ -25,15 +25,9 @@ class TargetController:
     async def connect(self):
         """Connect to target UART if not already connected."""
         # Check if existing connection is still alive
-        if self.device is not None:
-            try:
-                # Quick health check - see if reader/writer still exist
-                if self.device.reader is None or self.device.writer is None or self.device.writer.is_closing():
-                    log.info(f"[TargetController] Connection dead, reconnecting to {self.port}")
-                    self.device = None
-            except Exception as e:
-                log.info(f"[TargetController] Health check failed: {e}, reconnecting")
-                self.device = None
+        if self.device is not None and not self.device.is_alive():
+            log.info(f"[TargetController] Connection dead, reconnecting to {self.port}")
+            self.device = None
         
         if self.device is None:
             self.device = AsyncSerialDevice(self.port, self.baudrate)
@@ -59,7 +53,7 @@ class TargetController:
             await self.connect()
             try:
                 while True:
-                    line = await self.device.read()
+                    line = await self.device.read_line()
                     if line:
                         log.info(f"{line}")
             except asyncio.CancelledError:
@@ -203,7 +203,7 @@ async def run_interactive(device: AsyncSerialDevice, context: VariableContext):
     async def collect_lines():
         while True:
             try:
-                line = await asyncio.wait_for(device.line_queue.get(), timeout=0.1)
+                line = await device.read_line(timeout=0.1)
                 incoming_lines.append(line)
                 print(f"  <- {line}")
             except asyncio.TimeoutError:
@@ -231,15 +231,10 @@ async def run_interactive(device: AsyncSerialDevice, context: VariableContext):
             elif cmd == 'vars':
                 print(f"Variables: {context.get_all()}")
             elif cmd == 'drain':
-                count = 0
-                while not device.line_queue.empty():
-                    try:
-                        line = device.line_queue.get_nowait()
-                        print(f"  (drained) {line}")
-                        count += 1
-                    except:
-                        break
-                print(f"Drained {count} lines")
+                drained = device.drain_lines()
+                for line in drained:
+                    print(f"  (drained) {line}")
+                print(f"Drained {len(drained)} lines")
             elif cmd.startswith('send '):
                 text = cmd[5:]
                 text, missing = substitute_variables(text, context.get_all())
@@ -401,16 +396,11 @@ async def main():
         await asyncio.sleep(0.5)
         
         # Drain any pending data
-        drained = 0
-        while not device.line_queue.empty():
-            try:
-                line = device.line_queue.get_nowait()
-                logger.debug(f"Drained: {line}")
-                drained += 1
-            except:
-                break
+        drained = device.drain_lines()
+        for line in drained:
+            logger.debug(f"Drained: {line}")
         if drained:
-            logger.info(f"Drained {drained} pending lines")
+            logger.info(f"Drained {len(drained)} pending lines")
         
         if args.interactive:
             await run_interactive(device, context)